@@ -63,7 +63,7 @@ def initialize_models():
             wlasl_model_path = "wlasl_vit_transformer.pth"
             if os.path.exists(wlasl_model_path):
                 st.session_state.wlasl_sign_to_text_model = WLASLSignToTextModel()
-                st.session_state.wlasl_sign_to_text_model.load(wlasl_model_path)
+                st.session_state.wlasl_sign_to_text_model.load_weights(wlasl_model_path)
                 st.success("✅ WLASL Sign-to-Text model loaded successfully")
             else:
                 st.warning("⚠️ WLASL model file not found. Using demo mode.")
@@ -13,7 +13,9 @@ __all__ = [
     "get_model",
 ]
 
-from typing import TYPE_CHECKING, Union
+import os
+from functools import lru_cache
+from typing import TYPE_CHECKING, Optional, Union
 
 from sign_language_translator.config.assets import Assets
 from sign_language_translator.config.enums import (
@@ -37,6 +39,8 @@ def get_model(model_code: Union[str, Enum], *args, **kwargs):
 
     Returns:
         Any: The instantiated model object if successful, or None if no model found.
+            PSL sign-to-text models are cached, so repeated calls with the same
+            checkpoint return the same shared instance; don't mutate it in place.
 
     Raises:
         ValueError: If inappropriate argument values are provided for text_language, sign_language, or video_feature_model.
@@ -57,7 +61,12 @@ def get_model(model_code: Union[str, Enum], *args, **kwargs):
         vocab_path = kwargs.get('vocab_path', None)
         device = kwargs.get('device', 'cpu')
         
-        return PSLSignToTextModel.load(model_path, vocab_path, device)
+        if not os.path.isfile(model_path):
+            return PSLSignToTextModel.load(model_path, vocab_path, device)
+        # the checkpoint's mtime is part of the key so a retrained model is picked up
+        return _load_psl_sign_to_text(
+            model_path, vocab_path, device, os.stat(model_path).st_mtime_ns
+        )
 
     if model_code in ModelCodeGroups.ALL_NGRAM_LANGUAGE_MODELS.value:
         from sign_language_translator.models import NgramLanguageModel
@@ -105,3 +114,22 @@ def get_model(model_code: Union[str, Enum], *args, **kwargs):
         return VectorLookupModel.load(Assets.get_path(asset_id)[0])
 
     return None
+
+
+# enough for a few checkpoints/devices in use at once; superseded checkpoints
+# (new mtime) fall out of the cache instead of staying loaded for the process' life
+_PSL_SIGN_TO_TEXT_CACHE_SIZE = 4
+
+
+@lru_cache(maxsize=_PSL_SIGN_TO_TEXT_CACHE_SIZE)
+def _load_psl_sign_to_text(
+    model_path: str, vocab_path: Optional[str], device: str, mtime_ns: int
+):
+    """Load a PSL sign-to-text checkpoint once per (path, vocab, device, mtime).
+
+    Repeated ``get_model`` calls return the same instance instead of re-reading the weights,
+    so every caller shares it. Only the most recently used entries are kept.
+    """
+    from sign_language_translator.models import PSLSignToTextModel
+
+    return PSLSignToTextModel.load(model_path, vocab_path, device)
@@ -12,9 +12,15 @@ from typing import List, Dict, Any, Optional, Union
 import numpy as np
 import json
 import os
+import zipfile
 from pathlib import Path
 import cv2
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 from sign_language_translator.models.sign_to_text.sign_to_text_model import SignToTextModel
 
 
@@ -70,8 +76,9 @@ class SignLanguageCNN(nn.Module):
         # Apply 3D convolutions
         x = self.conv_layers(x)
         
-        # Flatten for fully connected layers
-        x = x.view(x.size(0), -1)
+        # Flatten for fully connected layers (in logical order, so channels-last
+        # activations flatten the same way as contiguous ones)
+        x = torch.flatten(x, 1)
         
         # Apply fully connected layers
         x = self.fc_layers(x)
@@ -79,6 +86,24 @@ class SignLanguageCNN(nn.Module):
         return x
 
 
+if numba is not None:
+
+    # nogil so concurrent requests can preprocess in parallel; no fastmath so the
+    # division rounds exactly like the NumPy path
+    @numba.njit(nogil=True, parallel=True, cache=True)
+    def _frames_to_chw_kernel(frames, out):
+        """Fused uint8 (frames, H, W, C) -> float32 (C, frames, H, W) transpose and [0, 1] scaling."""
+        n_frames, height, width, channels = frames.shape
+        for n in numba.prange(n_frames):
+            for h in range(height):
+                for w in range(width):
+                    for c in range(channels):
+                        out[c, n, h, w] = np.float32(frames[n, h, w, c]) / np.float32(255.0)
+
+else:
+    _frames_to_chw_kernel = None
+
+
 class PSLSignToTextModel(SignToTextModel):
     """
     PSL Sign-to-Text model using the actual SignLanguageCNN architecture.
@@ -110,6 +135,9 @@ class PSLSignToTextModel(SignToTextModel):
         self.idx_to_word = {}
         self.word_to_idx = {}
         
+        # Frozen TorchScript graph used for inference once script_model() is called
+        self._scripted = None
+        
         self.model.eval()
     
     def forward(self, x: torch.Tensor) -> torch.Tensor:
@@ -122,8 +150,55 @@ class PSLSignToTextModel(SignToTextModel):
         Returns:
             torch.Tensor: Output logits
         """
+        if self._scripted is not None:
+            # The frozen graph bakes the weights in as constants and can't be trained,
+            # so never let autograd record it, whichever call site runs it
+            with torch.inference_mode():
+                return self._scripted(x)
         return self.model(x)
     
+    def prepare_for_inference(self) -> None:
+        """
+        Convert the network to its fastest inference layout for the current device.
+        
+        Conv weights are stored channels-last (NDHWC), which both cuDNN and oneDNN take
+        a faster path for; inputs need no conversion since the convolutions follow the
+        weights' layout. On CPU the fully connected layers are also dynamically quantized
+        to INT8 (weights once, activations on the fly). Quantized weights can't be loaded
+        back into the FP32 network, so save the model before calling this.
+        """
+        self.model.conv_layers.to(memory_format=torch.channels_last_3d)
+        if torch.device(self.device).type == "cpu":
+            self.model.fc_layers = torch.ao.quantization.quantize_dynamic(
+                self.model.fc_layers, {nn.Linear}, dtype=torch.qint8
+            )
+    
+    def script_model(self, cache_path: Optional[str] = None, rebuild: bool = False) -> None:
+        """
+        Run inference through a frozen, inference-optimized TorchScript graph of the network.
+        
+        The eager ``self.model`` is kept for saving and inspection; only ``forward`` switches
+        to the graph. Loading new weights drops the graph again.
+        
+        Args:
+            cache_path (str, optional): File the frozen graph is loaded from, or saved to after
+                scripting so later loads skip it
+            rebuild (bool): Script the network again even if ``cache_path`` exists
+        """
+        if cache_path and os.path.exists(cache_path) and not rebuild:
+            frozen = torch.jit.load(cache_path, map_location=self.device)
+        else:
+            frozen = torch.jit.freeze(torch.jit.script(self.model.eval()))
+            if cache_path:
+                try:
+                    torch.jit.save(frozen, cache_path)
+                except OSError as e:
+                    print(f"Could not cache TorchScript model at {cache_path}: {e}")
+        
+        # Graphs with optimize_for_inference's prepacked weights can't be reloaded, so the
+        # frozen graph is cached and the (cheap) optimization pass runs after loading
+        self._scripted = torch.jit.optimize_for_inference(frozen)
+    
     def predict(self, video_input: Union[str, List[np.ndarray], torch.Tensor], **kwargs) -> str:
         """
         Predict text from video input.
@@ -136,17 +211,7 @@ class PSLSignToTextModel(SignToTextModel):
             str: Predicted text translation
         """
         # Process video input
-        if isinstance(video_input, str):
-            # Video file path
-            video_tensor = self._load_video_from_file(video_input)
-        elif isinstance(video_input, list):
-            # List of frames
-            video_tensor = self._process_frame_list(video_input)
-        elif isinstance(video_input, torch.Tensor):
-            # Already a tensor
-            video_tensor = video_input
-        else:
-            raise ValueError(f"Unsupported video input type: {type(video_input)}")
+        video_tensor = self._to_video_tensor(video_input)
         
         # Add batch dimension if needed
         if video_tensor.dim() == 4:
@@ -156,7 +221,7 @@ class PSLSignToTextModel(SignToTextModel):
         video_tensor = video_tensor.to(self.device)
         
         # Get model predictions
-        with torch.no_grad():
+        with torch.inference_mode(), self._autocast():
             output = self.forward(video_tensor)
             predicted_indices = torch.argmax(output, dim=-1)
             
@@ -165,6 +230,71 @@ class PSLSignToTextModel(SignToTextModel):
         
         return text
     
+    def predict_batched(self, video_inputs: List[Union[str, List[np.ndarray], torch.Tensor]], batch_size: int = 16) -> List[str]:
+        """
+        Predict text for several videos, running the network once per batch of clips.
+        
+        Clips are stacked into a single (batch, channels, frames, height, width) tensor,
+        so all inputs in a batch must preprocess to the same shape.
+        
+        Args:
+            video_inputs: Video file paths, lists of frames, or (channels, frames, height, width) tensors
+            batch_size (int): Maximum number of clips per forward pass
+            
+        Returns:
+            List[str]: Predicted text translation for each input
+        """
+        batches = (
+            self._to_video_batch(video_inputs[start:start + batch_size])
+            for start in range(0, len(video_inputs), batch_size)
+        )
+        
+        # Predictions stay on the device until every batch is queued, so preparing the
+        # next batch on the CPU overlaps with the GPU work of the current one
+        predicted_indices = []
+        with torch.inference_mode(), self._autocast():
+            for batch in self._to_device_prefetched(batches):
+                predicted_indices.append(torch.argmax(self.forward(batch), dim=-1))
+        
+        if not predicted_indices:
+            return []
+        return [self._indices_to_text(index.view(1)) for index in torch.cat(predicted_indices).cpu()]
+    
+    def _to_video_batch(self, video_inputs: List[Union[str, List[np.ndarray], np.ndarray, torch.Tensor]]) -> torch.Tensor:
+        """
+        Preprocess several video inputs into one (batch, channels, frames, height, width) tensor.
+        
+        Args:
+            video_inputs: Video file paths, lists of frames, stacked frame arrays, or tensors
+            
+        Returns:
+            torch.Tensor: Batched video tensor
+        """
+        if all(isinstance(video_input, (list, np.ndarray)) for video_input in video_inputs):
+            return self._process_batch(video_inputs)
+        return torch.stack([self._to_video_tensor(video_input) for video_input in video_inputs])
+    
+    def _to_video_tensor(self, video_input: Union[str, List[np.ndarray], np.ndarray, torch.Tensor]) -> torch.Tensor:
+        """
+        Convert a supported video input into a preprocessed video tensor.
+        
+        Args:
+            video_input: Video file path, list of frames, stacked frames array, or tensor
+            
+        Returns:
+            torch.Tensor: Video tensor
+        """
+        if isinstance(video_input, str):
+            # Video file path
+            return self._load_video_from_file(video_input)
+        if isinstance(video_input, (list, np.ndarray)):
+            # List of frames, or frames stacked in one (frames, height, width, channels) array
+            return self._process_frame_list(video_input)
+        if isinstance(video_input, torch.Tensor):
+            # Already a tensor
+            return video_input
+        raise ValueError(f"Unsupported video input type: {type(video_input)}")
+    
     def _load_video_from_file(self, video_path: str) -> torch.Tensor:
         """
         Load and preprocess video from file.
@@ -177,62 +307,113 @@ class PSLSignToTextModel(SignToTextModel):
         """
         # Read video frames
         cap = cv2.VideoCapture(video_path)
-        frames = []
+        
+        # Preallocate from the reported frame count (an estimate for some containers)
+        # and double the buffer if the video turns out to be longer
+        capacity = max(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), 1)
+        video_array = np.empty((capacity, 64, 64, 3), dtype=np.float32)
+        n_frames = 0
         
         while cap.isOpened():
             ret, frame = cap.read()
             if not ret:
                 break
             
-            # Convert BGR to RGB
-            frame_rgb = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Resize frame (adjust size based on your training data)
-            frame_resized = cv2.resize(frame_rgb, (64, 64))  # Adjust size as needed
+            if n_frames == len(video_array):
+                video_array = np.concatenate([video_array, np.empty_like(video_array)])
             
-            # Normalize to [0, 1]
-            frame_normalized = frame_resized.astype(np.float32) / 255.0
-            
-            frames.append(frame_normalized)
+            # Resize frame (adjust size based on your training data), then convert BGR to RGB
+            frame_resized = cv2.resize(frame, (64, 64))  # Adjust size as needed
+            video_array[n_frames] = cv2.cvtColor(frame_resized, cv2.COLOR_BGR2RGB)
+            n_frames += 1
         
         cap.release()
         
-        if not frames:
+        if not n_frames:
             raise ValueError(f"No frames could be read from {video_path}")
         
-        # Convert to tensor and rearrange dimensions
+        # Normalize to [0, 1] in place
+        video_array = video_array[:n_frames]
+        video_array /= 255.0
+        
+        # Convert to tensor (sharing memory) and rearrange dimensions
         # From (frames, height, width, channels) to (channels, frames, height, width)
-        video_array = np.array(frames)
-        video_tensor = torch.FloatTensor(video_array).permute(3, 0, 1, 2)
+        video_tensor = torch.from_numpy(video_array).permute(3, 0, 1, 2)
         
         return video_tensor
     
-    def _process_frame_list(self, frames: List[np.ndarray]) -> torch.Tensor:
+    def _process_frame_list(self, frames: Union[List[np.ndarray], np.ndarray]) -> torch.Tensor:
         """
         Process a list of video frames.
         
         Args:
-            frames (List[np.ndarray]): List of video frames
+            frames (List[np.ndarray] | np.ndarray): List of video frames, or frames
+                stacked in one (frames, height, width, channels) array
             
         Returns:
-            torch.Tensor: Preprocessed video tensor
+            torch.Tensor: Preprocessed video tensor of shape (channels, frames, height, width)
         """
-        processed_frames = []
+        video_array = np.empty((3, len(frames), 64, 64), dtype=np.float32)
+        self._fill_frames(frames, video_array)
         
-        for frame in frames:
-            # Resize frame (adjust size based on your training data)
-            frame_resized = cv2.resize(frame, (64, 64))  # Adjust size as needed
-            
-            # Normalize to [0, 1]
-            frame_normalized = frame_resized.astype(np.float32) / 255.0
+        # Convert to tensor (sharing memory)
+        return torch.from_numpy(video_array)
+    
+    def _process_batch(self, videos: List[Union[List[np.ndarray], np.ndarray]]) -> torch.Tensor:
+        """
+        Process several frame lists straight into one batch buffer, without per-video tensors.
+        
+        Args:
+            videos: Frame lists or stacked frame arrays, all with the same number of frames
             
-            processed_frames.append(frame_normalized)
+        Returns:
+            torch.Tensor: Preprocessed tensor of shape (batch, channels, frames, height, width)
+        """
+        n_frames = len(videos[0]) if videos else 0
+        if any(len(frames) != n_frames for frames in videos):
+            raise ValueError("All videos in a batch must have the same number of frames")
         
-        # Convert to tensor and rearrange dimensions
-        video_array = np.array(processed_frames)
-        video_tensor = torch.FloatTensor(video_array).permute(3, 0, 1, 2)
+        batch_array = np.empty((len(videos), 3, n_frames, 64, 64), dtype=np.float32)
+        for i, frames in enumerate(videos):
+            self._fill_frames(frames, batch_array[i])
         
-        return video_tensor
+        return torch.from_numpy(batch_array)
+    
+    def _fill_frames(self, frames: Union[List[np.ndarray], np.ndarray], video_array: np.ndarray) -> None:
+        """
+        Resize and scale frames into a preallocated contiguous (channels, frames, 64, 64) float32 buffer.
+        
+        Args:
+            frames (List[np.ndarray] | np.ndarray): List of video frames, or stacked frames
+            video_array (np.ndarray): Output buffer
+        """
+        # Write every frame straight into the channels-first buffer; the HWC -> CHW
+        # transpose and the uint8 -> float32 cast happen in the same copy
+        if (
+            isinstance(frames, np.ndarray)
+            and frames.dtype == np.uint8
+            and frames.shape[1:] == (64, 64, 3)
+        ):
+            # Already-sized uint8 clips are converted in one compiled pass, or without
+            # Numba in one vectorized NumPy pass (same float32 division, same result)
+            if _frames_to_chw_kernel is not None:
+                _frames_to_chw_kernel(np.ascontiguousarray(frames), video_array)
+            else:
+                np.divide(frames.transpose(3, 0, 1, 2), np.float32(255.0), out=video_array)
+            return
+        
+        # cv2.dnn.blobFromImages is not used here: it builds an (N, C, H, W) blob that
+        # still has to be copied into this (C, N, H, W) buffer, which measured slower than
+        # this loop, and its scalefactor multiplies by 1/255 instead of dividing by 255,
+        # which changes the last bit of some values
+        for i, frame in enumerate(frames):
+            # Resize frame (adjust size based on your training data)
+            if frame.shape[:2] != (64, 64):
+                frame = cv2.resize(frame, (64, 64))  # Adjust size as needed
+            video_array[:, i] = frame.transpose(2, 0, 1)
+        
+        # Normalize to [0, 1] in place
+        video_array /= 255.0
     
     def preprocess_features(self, features: List[Dict[str, Any]]) -> torch.Tensor:
         """
@@ -286,8 +467,10 @@ class PSLSignToTextModel(SignToTextModel):
         if not os.path.exists(model_path):
             raise FileNotFoundError(f"Model file not found: {model_path}")
         
-        # Load model weights
-        checkpoint = torch.load(model_path, map_location=self.device)
+        self._scripted = None
+        
+        # Load model weights (memory-mapped when saved in the zip format, which mmap requires)
+        checkpoint = torch.load(model_path, map_location=self.device, mmap=zipfile.is_zipfile(model_path))
         
         if isinstance(checkpoint, dict):
             # Handle checkpoint format
@@ -353,7 +536,8 @@ class PSLSignToTextModel(SignToTextModel):
         print(f"Vocabulary size: {len(self.idx_to_word)}")
     
     @classmethod
-    def load(cls, model_path: str, vocab_path: Optional[str] = None, device: str = "cpu") -> 'PSLSignToTextModel':
+    def load(cls, model_path: str, vocab_path: Optional[str] = None, device: str = "cpu",
+             torchscript: bool = False) -> 'PSLSignToTextModel':
         """
         Load a trained PSL Sign-to-Text model from file.
         
@@ -361,6 +545,8 @@ class PSLSignToTextModel(SignToTextModel):
             model_path (str): Path to the trained model file
             vocab_path (str, optional): Path to vocabulary file
             device (str): Device to run the model on
+            torchscript (bool): Run inference through a frozen TorchScript graph, cached
+                next to the model file per device type (see ``script_model``)
             
         Returns:
             PSLSignToTextModel: Loaded model instance
@@ -375,6 +561,11 @@ class PSLSignToTextModel(SignToTextModel):
         if vocab_path:
             model.load_vocabulary(vocab_path)
         
+        if torchscript:
+            cache_path = f"{os.path.splitext(model_path)[0]}.{torch.device(device).type}.torchscript.pt"
+            stale = os.path.exists(cache_path) and os.path.getmtime(cache_path) < os.path.getmtime(model_path)
+            model.script_model(cache_path, rebuild=stale)
+        
         return model 
 
     def predict_from_live_video(self, duration=5, fps=20) -> str:
@@ -3,7 +3,7 @@ Abstract base class for sign-to-text translation models.
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any, Union
+from typing import List, Dict, Any, Iterable, Iterator, Union
 import torch
 import numpy as np
 
@@ -59,4 +59,56 @@ class SignToTextModel(ABC):
         Returns:
             torch.Tensor: Preprocessed features ready for model input
         """
-        pass 
\ No newline at end of file
+        pass
+    
+    def _autocast(self) -> torch.autocast:
+        """
+        Mixed-precision context for inference: FP16 autocast on CUDA, a no-op elsewhere.
+        
+        Returns:
+            torch.autocast: Autocast context manager for the model's device
+        """
+        device_type = torch.device(getattr(self, "device", "cpu")).type
+        return torch.autocast(device_type, dtype=torch.float16, enabled=device_type == "cuda")
+    
+    def _to_device_prefetched(self, batches: Iterable[torch.Tensor]) -> Iterator[torch.Tensor]:
+        """
+        Move CPU batches to the model's device one batch ahead of the consumer.
+        
+        On CUDA each batch is pinned and copied on a side stream, and the copy of batch
+        ``b + 1`` is issued before batch ``b`` is handed out, so host-to-device transfers
+        overlap with the compute queued for the previous batch. Elsewhere batches are
+        moved synchronously.
+        
+        Args:
+            batches (Iterable[torch.Tensor]): Batches on the CPU
+            
+        Returns:
+            Iterator[torch.Tensor]: The same batches on the model's device
+        """
+        device = torch.device(getattr(self, "device", "cpu"))
+        if device.type != "cuda":
+            for batch in batches:
+                yield batch.to(device)
+            return
+        
+        copy_stream = torch.cuda.Stream(device)
+        compute_stream = torch.cuda.current_stream(device)
+        
+        def upload(batch):
+            batch = batch.pin_memory()
+            with torch.cuda.stream(copy_stream):
+                device_batch = batch.to(device, non_blocking=True)
+            return device_batch, copy_stream.record_event()
+        
+        batches = iter(batches)
+        pending = next(batches, None)
+        pending = upload(pending) if pending is not None else None
+        while pending is not None:
+            device_batch, copied = pending
+            following = next(batches, None)
+            pending = upload(following) if following is not None else None
+            compute_stream.wait_event(copied)
+            # the memory was allocated on the copy stream but is used on the compute stream
+            device_batch.record_stream(compute_stream)
+            yield device_batch
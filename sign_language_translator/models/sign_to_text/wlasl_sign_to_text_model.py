@@ -6,8 +6,9 @@ for translating WLASL (Word-Level American Sign Language) video features to text
 
 import os
 import pickle
+import zipfile
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Union
 
 import numpy as np
 import torch
@@ -145,7 +146,7 @@ class WLASLSignToTextModel(SignToTextModel):
         
         # Load model weights if provided
         if model_path and os.path.exists(model_path):
-            self.load(model_path)
+            self.load_weights(model_path)
         
         self.model.to(device)
         self.model.eval()
@@ -205,8 +206,8 @@ class WLASLSignToTextModel(SignToTextModel):
         # Normalize to [0, 1]
         frames_tensor = frames_tensor / 255.0
         
-        # Reshape to (1, channels, frames, height, width)
-        frames_tensor = frames_tensor.permute(0, 3, 1, 2).unsqueeze(0)
+        # Reshape (frames, height, width, channels) to (1, channels, frames, height, width)
+        frames_tensor = frames_tensor.permute(3, 0, 1, 2).unsqueeze(0)
         
         return frames_tensor
     
@@ -220,7 +221,7 @@ class WLASLSignToTextModel(SignToTextModel):
         Returns:
             Predicted WLASL gloss
         """
-        with torch.no_grad():
+        with torch.inference_mode(), self._autocast():
             # Process frames
             input_tensor = self._process_frame_list(video_frames)
             input_tensor = input_tensor.to(self.device)
@@ -247,27 +248,86 @@ class WLASLSignToTextModel(SignToTextModel):
         Returns:
             List of predicted WLASL glosses
         """
-        predictions = []
-        for frames in video_frames_list:
-            prediction = self.predict(frames)
-            predictions.append(prediction)
+        return self.predict_batched(video_frames_list)
+    
+    def predict_batched(self, video_frames_list: List[List[np.ndarray]], batch_size: int = 16) -> List[str]:
+        """
+        Predict WLASL glosses for several video sequences, one forward pass per batch.
+        
+        Sequences are concatenated along the batch dimension, so only sequences with
+        the same number of frames and frame size share a batch; sequences of other
+        shapes go into batches of their own.
+        
+        Args:
+            video_frames_list: List of video frame sequences
+            batch_size: Maximum number of sequences per forward pass
+            
+        Returns:
+            List of predicted WLASL glosses, in the order of ``video_frames_list``
+        """
+        shape_groups: Dict[tuple, List[int]] = {}
+        for index, frames in enumerate(video_frames_list):
+            shape = (len(frames), np.shape(frames[0]) if len(frames) else ())
+            shape_groups.setdefault(shape, []).append(index)
+        batch_indices = [
+            indices[start:start + batch_size]
+            for indices in shape_groups.values()
+            for start in range(0, len(indices), batch_size)
+        ]
+        batches = (
+            torch.cat([self._process_frame_list(video_frames_list[index]) for index in indices])
+            for indices in batch_indices
+        )
+        
+        # Keep predictions on the device until all batches are queued so CPU preprocessing
+        # of the next batch overlaps with the GPU work of the current one
+        predicted_classes = []
+        with torch.inference_mode(), self._autocast():
+            for input_tensor in self._to_device_prefetched(batches):
+                predicted_classes.append(torch.argmax(self.model(input_tensor), dim=1))
+        
+        if not predicted_classes:
+            return []
+        predictions = [None] * len(video_frames_list)
+        batch_order = (index for indices in batch_indices for index in indices)
+        for index, predicted_class in zip(batch_order, torch.cat(predicted_classes).tolist()):
+            predictions[index] = self.vocabulary[predicted_class]
         return predictions
     
-    def load(self, model_path: str):
-        """Load model weights from file."""
-        try:
-            checkpoint = torch.load(model_path, map_location=self.device)
+    def load_weights(self, model_path: str):
+        """
+        Load model weights from file.
+        
+        Args:
+            model_path: Path to a checkpoint holding a state dict, either bare or under
+                ``model_state_dict`` / ``state_dict``
             
-            if 'model_state_dict' in checkpoint:
-                self.model.load_state_dict(checkpoint['model_state_dict'])
-            elif 'state_dict' in checkpoint:
-                self.model.load_state_dict(checkpoint['state_dict'])
-            else:
-                self.model.load_state_dict(checkpoint)
-                
-            print(f"✅ WLASL model loaded successfully from {model_path}")
-        except Exception as e:
-            print(f"❌ Error loading WLASL model: {e}")
+        Raises:
+            Exception: Whatever ``torch.load`` / ``load_state_dict`` raise for a missing,
+                corrupt or mismatched checkpoint, so a failed load never leaves an
+                untrained model looking loaded
+        """
+        # Memory-mapped when saved in the zip format, which mmap requires
+        checkpoint = torch.load(model_path, map_location=self.device, mmap=zipfile.is_zipfile(model_path))
+        
+        if 'model_state_dict' in checkpoint:
+            self.model.load_state_dict(checkpoint['model_state_dict'])
+        elif 'state_dict' in checkpoint:
+            self.model.load_state_dict(checkpoint['state_dict'])
+        else:
+            self.model.load_state_dict(checkpoint)
+        
+        self.model.eval()
+        print(f"✅ WLASL model loaded successfully from {model_path}")
+    
+    def load_model(self, model_path: str) -> None:
+        """
+        Load a trained model from file (see ``load_weights``).
+        
+        Args:
+            model_path (str): Path to the trained model file
+        """
+        self.load_weights(model_path)
     
     def save(self, model_path: str):
         """Save model weights to file."""
@@ -281,11 +341,35 @@ class WLASLSignToTextModel(SignToTextModel):
         except Exception as e:
             print(f"❌ Error saving WLASL model: {e}")
     
+    def save_model(self, model_path: str) -> None:
+        """
+        Save the trained model to file (see ``save``).
+        
+        Args:
+            model_path (str): Path where to save the model
+        """
+        self.save(model_path)
+    
+    def preprocess_features(self, features: List[Dict[str, Any]]) -> torch.Tensor:
+        """
+        Preprocess per-frame video features for model input.
+        
+        The CNN+LSTM network works on the frames themselves, so each feature dict
+        carries its frame image under ``"frame"``.
+        
+        Args:
+            features: One dict per video frame, with the (height, width, 3) BGR frame under ``"frame"``
+            
+        Returns:
+            Tensor of shape (1, channels, frames, height, width), as passed to the network by ``predict``
+        """
+        return self._process_frame_list([feature["frame"] for feature in features])
+    
     @classmethod
     def load(cls, model_path: str, device: str = "cpu", **kwargs) -> "WLASLSignToTextModel":
         """Load a trained WLASL model from file."""
         model = cls(device=device, **kwargs)
-        model.load(model_path)
+        model.load_weights(model_path)
         return model
     
     def get_vocabulary(self) -> List[str]:
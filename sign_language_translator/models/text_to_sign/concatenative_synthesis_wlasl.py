@@ -4,16 +4,22 @@ by concatenating sign language videos and landmarks."""
 
 from __future__ import annotations
 
+import functools
 import json
 import os
 import pickle
 import random
 from pathlib import Path
-from typing import Dict, List, Optional, Union
+from typing import Dict, List, Optional, Tuple, Union
 
 import numpy as np
 import pandas as pd
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from sign_language_translator.config.enums import SignFormats
 from sign_language_translator.languages import get_text_language
 from sign_language_translator.languages.text import TextLanguage
@@ -22,6 +28,35 @@ from sign_language_translator.vision.sign.sign import Sign
 from sign_language_translator.utils.augmentation import augment_landmarks, preprocess_landmarks
 
 
+def _read_json(path: str):
+    """Parse a JSON file, with orjson when it is installed."""
+    data = Path(path).read_bytes()
+    return orjson.loads(data) if orjson is not None else json.loads(data)
+
+
+@functools.lru_cache(maxsize=8)
+def _load_json(path: str, mtime_ns: int):
+    """Parse a JSON file, cached per path and modification time so that
+    repeated model instantiations do not re-parse unchanged mapping files."""
+    return _read_json(path)
+
+
+@functools.lru_cache(maxsize=8)
+def _wlasl_gloss_index(path: str, mtime_ns: int):
+    """Build ``(gloss -> video_id, video_id -> gloss)`` from a filtered WLASL json.
+    The last instance listed for a gloss wins. Only the index is cached: the parsed
+    list is read uncached so it can be freed once the index is built."""
+    gloss_to_video_id: Dict[str, str] = {}
+    video_id_to_gloss: Dict[str, str] = {}
+    for entry in _read_json(path):
+        gloss = entry["gloss"]
+        for instance in entry["instances"]:
+            video_id = instance["video_id"]
+            gloss_to_video_id[gloss] = video_id
+            video_id_to_gloss[video_id] = gloss
+    return gloss_to_video_id, video_id_to_gloss
+
+
 class WLASLConcatenativeSynthesis(TextToSignModel):
     """A class representing a Rule-Based model for translating text to WLASL
     by concatenating sign language videos and landmarks.
@@ -51,6 +86,10 @@ class WLASLConcatenativeSynthesis(TextToSignModel):
         self._psl_to_wlasl_mapping = {}
         self._gloss_to_video_id = {}
         self._video_id_to_gloss = {}
+        self._gloss_landmarks_path: Dict[str, str] = {}
+        # (folder name, landmarks file) of every landmark folder, for substring lookups
+        self._landmark_folders: List[Tuple[str, str]] = []
+        self._gloss_video_path: Dict[str, str] = {}
         
         # Load mappings
         self._load_mappings()
@@ -70,22 +109,49 @@ class WLASLConcatenativeSynthesis(TextToSignModel):
         # Load PSL to WLASL mapping
         psl_to_wlasl_path = mappings_dir / "psl_to_wlasl_mapping.json"
         if psl_to_wlasl_path.exists():
-            with open(psl_to_wlasl_path, 'r', encoding='utf-8') as f:
-                self._psl_to_wlasl_mapping = json.load(f)
+            self._psl_to_wlasl_mapping = dict(
+                _load_json(str(psl_to_wlasl_path), psl_to_wlasl_path.stat().st_mtime_ns)
+            )
         
-        # Load filtered WLASL data
+        # Load filtered WLASL data and its gloss <-> video_id indexes
         filtered_wlasl_path = mappings_dir / "filtered_wlasl.json"
         if filtered_wlasl_path.exists():
-            with open(filtered_wlasl_path, 'r', encoding='utf-8') as f:
-                wlasl_data = json.load(f)
-                
-            # Create gloss to video_id mapping
-            for entry in wlasl_data:
-                gloss = entry["gloss"]
-                for instance in entry["instances"]:
-                    video_id = instance["video_id"]
-                    self._gloss_to_video_id[gloss] = video_id
-                    self._video_id_to_gloss[video_id] = gloss
+            gloss_to_video_id, video_id_to_gloss = _wlasl_gloss_index(
+                str(filtered_wlasl_path), filtered_wlasl_path.stat().st_mtime_ns
+            )
+            self._gloss_to_video_id = dict(gloss_to_video_id)
+            self._video_id_to_gloss = dict(video_id_to_gloss)
+
+        self._build_path_indexes()
+
+    def _build_path_indexes(self):
+        """Scan the landmarks and videos directories once and index files by gloss.
+
+        Landmark folders are named ``{gloss}_{video_id}``; they are indexed both by
+        their full name and by the gloss prefix (first match wins), and also kept as
+        a sorted list for substring lookups, so lookups never need to walk the
+        filesystem again.
+        """
+        landmarks_dir = Path(self._assets_path) / "Augmented_LandMarks" / "Processed_Landmarks_WLASL"
+        if landmarks_dir.is_dir():
+            with os.scandir(landmarks_dir) as entries:
+                for entry in sorted(entries, key=lambda e: e.name):
+                    if not entry.is_dir():
+                        continue
+                    landmarks_file = os.path.join(entry.path, "landmarks_preprocessed.pkl")
+                    if not os.path.isfile(landmarks_file):
+                        continue
+                    self._gloss_landmarks_path[entry.name] = landmarks_file
+                    self._landmark_folders.append((entry.name, landmarks_file))
+                    gloss_prefix = entry.name.rsplit("_", 1)[0]
+                    self._gloss_landmarks_path.setdefault(gloss_prefix, landmarks_file)
+
+        videos_dir = Path(self._assets_path) / "Common_WLASL_videos" / "Common_WLASL_videos"
+        if videos_dir.is_dir():
+            with os.scandir(videos_dir) as entries:
+                for entry in entries:
+                    if entry.is_file() and entry.name.endswith(".mp4"):
+                        self._gloss_video_path[entry.name[: -len(".mp4")]] = entry.path
 
     @property
     def text_language(self) -> TextLanguage:
@@ -184,34 +250,23 @@ class WLASLConcatenativeSynthesis(TextToSignModel):
         return segments
 
     def _get_landmarks_path(self, gloss: str, video_id: str) -> Optional[str]:
-        """Get the path to landmarks file for a given gloss."""
-        landmarks_dir = Path(self._assets_path) / "Augmented_LandMarks" / "Processed_Landmarks_WLASL"
-        
-        # Look for the gloss directory
-        gloss_dir = landmarks_dir / f"{gloss}_{video_id}"
-        if gloss_dir.exists():
-            landmarks_file = gloss_dir / "landmarks_preprocessed.pkl"
-            if landmarks_file.exists():
-                return str(landmarks_file)
-        
-        # Try alternative naming patterns
-        for subdir in landmarks_dir.iterdir():
-            if subdir.is_dir() and gloss in subdir.name:
-                landmarks_file = subdir / "landmarks_preprocessed.pkl"
-                if landmarks_file.exists():
-                    return str(landmarks_file)
-        
-        return None
+        """Get the path to landmarks file for a given gloss.
+
+        Tries the ``{gloss}_{video_id}`` folder, then a folder whose gloss prefix is
+        ``gloss``, then (as before indexing) the first folder whose name contains ``gloss``.
+        """
+        landmarks_file = self._gloss_landmarks_path.get(
+            f"{gloss}_{video_id}", self._gloss_landmarks_path.get(gloss)
+        )
+        if landmarks_file is None:
+            landmarks_file = next(
+                (path for name, path in self._landmark_folders if gloss in name), None
+            )
+        return landmarks_file
 
     def _get_video_path(self, gloss: str) -> Optional[str]:
         """Get the path to video file for a given gloss."""
-        videos_dir = Path(self._assets_path) / "Common_WLASL_videos" / "Common_WLASL_videos"
-        video_file = videos_dir / f"{gloss}.mp4"
-        
-        if video_file.exists():
-            return str(video_file)
-        
-        return None
+        return self._gloss_video_path.get(gloss)
 
     def _concatenate_landmarks(self, sign_segments: List[Dict]) -> Sign:
         """
@@ -229,8 +284,7 @@ class WLASLConcatenativeSynthesis(TextToSignModel):
             landmarks_path = segment.get("landmarks_path")
             if landmarks_path and os.path.exists(landmarks_path):
                 try:
-                    with open(landmarks_path, 'rb') as f:
-                        landmarks = pickle.load(f)
+                    landmarks = pickle.loads(Path(landmarks_path).read_bytes())
                     
                     # Add landmarks to the sequence
                     if isinstance(landmarks, np.ndarray):
@@ -317,6 +371,21 @@ class WLASLConcatenativeSynthesis(TextToSignModel):
         sign_video.save(output_path)
         return output_path
 
+@functools.lru_cache(maxsize=8)
+def _label_index(dataset_csv: str, mtime_ns: int) -> Dict[str, str]:
+    """Build a lowercase ``label -> video_name`` lookup from a WLASL dataset CSV.
+
+    The first row of each label wins, matching the previous ``iloc[0]`` behaviour.
+    Cached per CSV path and modification time so repeated pipeline calls skip
+    re-parsing the file but still see edits to it.
+    """
+    dataset = pd.read_csv(dataset_csv)
+    index: Dict[str, str] = {}
+    for label, video_name in zip(dataset["label"].str.lower(), dataset["video_name"]):
+        index.setdefault(label, video_name)
+    return index
+
+
 def wlasl_text_to_sign_pipeline(
     text: str,
     dataset_csv: str,
@@ -341,27 +410,23 @@ def wlasl_text_to_sign_pipeline(
     Raises:
         ValueError if no valid landmark found for any gloss.
     """
-    dataset = pd.read_csv(dataset_csv)
+    label_index = _label_index(str(dataset_csv), Path(dataset_csv).stat().st_mtime_ns)
     words = text.lower().split()
     landmark_sequences = []
     for word in words:
-        match = dataset[dataset['label'].str.lower() == word]
-        if not match.empty:
-            video_name = match.iloc[0]['video_name']
-            folder_path = Path(landmark_dir) / video_name
-            processed_pkl = folder_path / 'landmarks_complete_processed.pkl'
-            if processed_pkl.exists():
-                with open(processed_pkl, 'rb') as f:
-                    landmarks = pickle.load(f)
-                if augment:
-                    landmarks = augment_landmarks(landmarks, **(augmentation_kwargs or {}))
-                if preprocess:
-                    landmarks = preprocess_landmarks(landmarks, **(preprocess_kwargs or {}))
-                landmark_sequences.append(landmarks)
-            else:
-                raise ValueError(f"Processed file not found for {word} (expected at {processed_pkl})")
-        else:
+        video_name = label_index.get(word)
+        if video_name is None:
             raise ValueError(f"No matching sign for word '{word}' in dataset.")
+        folder_path = Path(landmark_dir) / video_name
+        processed_pkl = folder_path / 'landmarks_complete_processed.pkl'
+        if not processed_pkl.exists():
+            raise ValueError(f"Processed file not found for {word} (expected at {processed_pkl})")
+        landmarks = pickle.loads(processed_pkl.read_bytes())
+        if augment:
+            landmarks = augment_landmarks(landmarks, **(augmentation_kwargs or {}))
+        if preprocess:
+            landmarks = preprocess_landmarks(landmarks, **(preprocess_kwargs or {}))
+        landmark_sequences.append(landmarks)
     if not landmark_sequences:
         raise ValueError("No landmark sequences generated.")
     # Concatenate
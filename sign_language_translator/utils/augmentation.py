@@ -4,33 +4,76 @@ import numpy as np
 from pathlib import Path
 import pandas as pd
 import logging
-from scipy.interpolate import interp1d
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from scipy.ndimage import gaussian_filter1d
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
 # --- AUGMENTATION ---
-def augment_landmarks(landmarks, rotation_angle=10, scale_factor=1.1, noise_std=0.01, frame_drop_prob=0.1):
-    augmented = landmarks.copy()
+_rng = np.random.default_rng()
+
+def augment_landmarks(landmarks, rotation_angle=10, scale_factor=1.1, noise_std=0.01, frame_drop_prob=0.1, rng=None):
+    rng = _rng if rng is None else rng
+    augmented = np.array(landmarks, dtype=np.float32)
     frames, keypoints, coords = augmented.shape
-    theta = np.radians(np.random.uniform(-rotation_angle, rotation_angle))
-    rotation_matrix = np.array([[np.cos(theta), -np.sin(theta)], [np.sin(theta), np.cos(theta)]])
-    scale = np.random.uniform(0.9, scale_factor)
-    xy = augmented[:, :, :2]
-    xy = np.dot(xy, rotation_matrix) * scale
-    augmented[:, :, :2] = xy
-    augmented += np.random.normal(0, noise_std, augmented.shape)
-    keep_mask = np.random.uniform(0, 1, frames) > frame_drop_prob
-    if keep_mask.sum() > 0:
-        augmented = augmented[keep_mask]
-        if len(augmented) < frames:
-            pad_size = frames - len(augmented)
-            augmented = np.pad(augmented, ((0, pad_size), (0, 0), (0, 0)), mode='edge')
-    else:
-        random_frame = augmented[np.random.randint(frames)][None, :, :]
-        augmented = np.repeat(random_frame, frames, axis=0)
-    return augmented
+    theta = np.radians(rng.uniform(-rotation_angle, rotation_angle))
+    scale = rng.uniform(0.9, scale_factor)
+    # row-vector rotation (xy @ R) with scale folded into the coefficients
+    c, s = np.float32(np.cos(theta) * scale), np.float32(np.sin(theta) * scale)
+    x = augmented[:, :, 0].copy()
+    y = augmented[:, :, 1]
+    augmented[:, :, 0] = c * x + s * y
+    augmented[:, :, 1] = c * y - s * x
+    if noise_std > 0:
+        noise = rng.standard_normal(augmented.shape, dtype=np.float32)
+        noise *= np.float32(noise_std)
+        augmented += noise
+    # drop frames and repeat the last kept one to restore the length, in one gather
+    keep_idx = np.flatnonzero(rng.random(frames) > frame_drop_prob)
+    if keep_idx.size == 0:
+        keep_idx = np.array([rng.integers(frames)])
+    gather_idx = keep_idx[np.minimum(np.arange(frames), keep_idx.size - 1)]
+    return augmented[gather_idx]
+
+_LANDMARK_PARTS = (('face', 468), ('left_hand', 21), ('right_hand', 21), ('pose', 33))
+
+def _dict_to_ndarray(landmarks, default_frames=57):
+    """Stack a ``{face, left_hand, right_hand, pose}`` landmark dict into a ``(frames, 543, 3)`` array.
+
+    Arrays are returned unchanged. Missing parts are zero-filled with the frame count
+    of the parts that are present (``default_frames`` if none are).
+    """
+    if isinstance(landmarks, np.ndarray):
+        return landmarks
+    parts = {name: np.asarray(landmarks[name]) for name, _ in _LANDMARK_PARTS if name in landmarks}
+    if len(parts) < len(_LANDMARK_PARTS):
+        frames = next(iter(parts.values())).shape[0] if parts else default_frames
+        for name, n_points in _LANDMARK_PARTS:
+            if name not in parts:
+                parts[name] = np.zeros((frames, n_points, 3))
+    return np.concatenate([parts[name] for name, _ in _LANDMARK_PARTS], axis=1)
+
+def _load_pickle(path):
+    return pickle.loads(Path(path).read_bytes())
+
+def _save_pickle(obj, path):
+    with open(path, 'wb') as f:
+        pickle.dump(obj, f)
+
+def _check_write(aug_path, future):
+    try:
+        future.result()
+        logging.info(f"Saved augmented landmarks_complete.pkl to {aug_path}")
+    except Exception as e:
+        logging.error(f"Failed to save {aug_path}: {e}")
 
-def augment_complete_to_all(landmark_dir, dataset_csv, num_augmentations_per_source=4):
+def augment_complete_to_all(landmark_dir, dataset_csv, num_augmentations_per_source=4, seed=None, max_workers=None):
     landmark_dir = Path(landmark_dir)
+    rng = np.random.default_rng(seed)
     try:
         dataset = pd.read_csv(dataset_csv)
         if not set(['video_name', 'label']).issubset(dataset.columns):
@@ -64,54 +107,133 @@ def augment_complete_to_all(landmark_dir, dataset_csv, num_augmentations_per_sou
         logging.info("All entries already have landmarks_complete.pkl")
         return
     target_idx = 0
-    for source_video, source_label in sources:
-        source_path = landmark_dir / source_video / 'landmarks_complete.pkl'
-        try:
-            with open(source_path, 'rb') as f:
-                landmarks = pickle.load(f)
-            if isinstance(landmarks, dict):
-                landmarks = np.concatenate([
-                    np.array(landmarks.get('face', np.zeros((57, 468, 3)))),
-                    np.array(landmarks.get('left_hand', np.zeros((57, 21, 3)))),
-                    np.array(landmarks.get('right_hand', np.zeros((57, 21, 3)))),
-                    np.array(landmarks.get('pose', np.zeros((57, 33, 3))))
-                ], axis=1)
-            elif not isinstance(landmarks, np.ndarray):
-                logging.error(f"Unexpected landmark format in {source_video}, skipping")
-                continue
-            if landmarks.shape[1] != 543 or landmarks.shape[2] != 3:
-                logging.error(f"Invalid shape for {source_video}: {landmarks.shape}, expected [frames, 543, 3]")
-                continue
-            if np.all(landmarks == 0) or np.any(np.isnan(landmarks)):
-                logging.error(f"Invalid data in {source_video}: contains zeros or NaNs")
-                continue
-            for i in range(num_augmentations_per_source):
-                if target_idx >= len(targets):
-                    break
-                target_video, target_label = targets[target_idx]
-                target_folder = landmark_dir / target_video
-                aug_path = target_folder / 'landmarks_complete.pkl'
-                if not target_folder.exists():
-                    logging.error(f"Target folder {target_folder} does not exist, skipping")
-                    target_idx += 1
+    source_paths = [landmark_dir / source_video / 'landmarks_complete.pkl' for source_video, _ in sources]
+    n_workers = max_workers or os.cpu_count() or 4
+    # pending writes hold their augmented arrays, so only a few per worker are kept in flight
+    max_pending_writes = 4 * n_workers
+    write_futures = deque()
+    with ThreadPoolExecutor(n_workers) as read_pool, ThreadPoolExecutor(n_workers) as write_pool:
+        # prefetch a window of sources so disk reads overlap with augmentation
+        loads = deque(read_pool.submit(_load_pickle, path) for path in source_paths[:n_workers])
+        for n, ((source_video, source_label), source_path) in enumerate(zip(sources, source_paths)):
+            if target_idx >= len(targets):
+                break
+            if n + n_workers < len(source_paths):
+                loads.append(read_pool.submit(_load_pickle, source_paths[n + n_workers]))
+            try:
+                landmarks = loads.popleft().result()
+                if not isinstance(landmarks, (dict, np.ndarray)):
+                    logging.error(f"Unexpected landmark format in {source_video}, skipping")
                     continue
-                aug_landmarks = augment_landmarks(landmarks)
-                try:
-                    with open(aug_path, 'wb') as f:
-                        pickle.dump(aug_landmarks, f)
-                    logging.info(f"Saved augmented landmarks_complete.pkl to {aug_path}")
-                    target_idx += 1
-                except Exception as e:
-                    logging.error(f"Failed to save {aug_path}: {e}")
-                    target_idx += 1
+                landmarks = _dict_to_ndarray(landmarks)
+                if landmarks.shape[1:] != (543, 3):
+                    logging.error(f"Invalid shape for {source_video}: {landmarks.shape}, expected [frames, 543, 3]")
                     continue
-        except Exception as e:
-            logging.error(f"Failed to load {source_path}: {e}")
-            continue
+                if not landmarks.any() or np.isnan(landmarks).any():
+                    logging.error(f"Invalid data in {source_video}: contains zeros or NaNs")
+                    continue
+                for i in range(num_augmentations_per_source):
+                    if target_idx >= len(targets):
+                        break
+                    target_video, target_label = targets[target_idx]
+                    target_folder = landmark_dir / target_video
+                    aug_path = target_folder / 'landmarks_complete.pkl'
+                    target_idx += 1
+                    if not target_folder.exists():
+                        logging.error(f"Target folder {target_folder} does not exist, skipping")
+                        continue
+                    aug_landmarks = augment_landmarks(landmarks, rng=rng)
+                    write_futures.append((aug_path, write_pool.submit(_save_pickle, aug_landmarks, aug_path)))
+                    while write_futures and (
+                        write_futures[0][1].done() or len(write_futures) > max_pending_writes
+                    ):
+                        _check_write(*write_futures.popleft())
+            except Exception as e:
+                logging.error(f"Failed to load {source_path}: {e}")
+                continue
+        for future in loads:
+            future.cancel()
+        while write_futures:
+            _check_write(*write_futures.popleft())
     logging.info(f"Completed augmentation for {target_idx} targets")
 
 # --- PREPROCESSING ---
+def _fill_nan_linear(data):
+    """Fill NaNs in each column of a 2D ``(T, N)`` array by linear interpolation along axis 0.
+
+    Gaps are interpolated between the surrounding valid samples and leading/trailing
+    NaNs are linearly extrapolated from the two nearest valid samples. Columns with a
+    single valid sample are held constant and all-NaN columns are set to 0.
+    """
+    nan_mask = np.isnan(data)
+    if not nan_mask.any():
+        return data
+    T = data.shape[0]
+    valid = ~nan_mask
+    cols = np.arange(data.shape[1])
+    t = np.arange(T)[:, None]
+
+    prev_idx = np.maximum.accumulate(np.where(valid, t, -1), axis=0)
+    next_idx = np.minimum.accumulate(np.where(valid, t, T)[::-1], axis=0)[::-1]
+
+    valid_count = valid.sum(axis=0)
+    cumulative = np.cumsum(valid, axis=0)
+    first = np.argmax(cumulative >= 1, axis=0)
+    second = np.where(valid_count > 1, np.argmax(cumulative >= 2, axis=0), first)
+    last = np.max(np.where(valid, t, -1), axis=0)
+    second_last = np.where(valid_count > 1, np.argmax(cumulative >= valid_count - 1, axis=0), last)
+
+    leading = prev_idx < 0
+    trailing = next_idx >= T
+    i0 = np.where(leading, first, np.where(trailing, second_last, prev_idx))
+    i1 = np.where(leading, second, np.where(trailing, last, next_idx))
+    i0 = np.clip(i0, 0, T - 1)
+    i1 = np.clip(i1, 0, T - 1)
+
+    y0 = data[i0, cols]
+    y1 = data[i1, cols]
+    span = i1 - i0
+    with np.errstate(invalid='ignore', divide='ignore'):
+        weight = np.where(span > 0, (t - i0) / np.where(span > 0, span, 1), 0.0).astype(data.dtype)
+    filled = np.where(nan_mask, y0 + (y1 - y0) * weight, data)
+    filled[:, valid_count == 0] = 0
+    return filled
+
+def _resample_columns(data, target_frames, columns):
+    """Linearly resample ``columns`` of a ``(T, N)`` array to ``target_frames`` rows; other columns are NaN."""
+    x = np.linspace(0, 1, data.shape[0])
+    x_new = np.linspace(0, 1, target_frames)
+    resampled = np.full((target_frames, data.shape[1]), np.nan, dtype=np.float32)
+    for j in columns:
+        resampled[:, j] = np.interp(x_new, x, data[:, j])
+    return resampled
+
+if numba is not None:
+
+    # nogil so concurrent requests (e.g. Streamlit sessions) can resample in parallel;
+    # no fastmath because partially-NaN columns must keep IEEE NaN semantics
+    @numba.njit(nogil=True, parallel=True, cache=True)
+    def _resample_rows_kernel(rows, x, x_new):
+        resampled = np.empty((rows.shape[0], x_new.size), dtype=np.float32)
+        for i in numba.prange(rows.shape[0]):
+            resampled[i] = np.interp(x_new, x, rows[i])
+        return resampled
+
+    def _resample_columns_jit(data, target_frames, columns):
+        """Numba version of ``_resample_columns``, resampling the selected columns as contiguous rows."""
+        x = np.linspace(0, 1, data.shape[0])
+        x_new = np.linspace(0, 1, target_frames)
+        resampled = np.full((target_frames, data.shape[1]), np.nan, dtype=np.float32)
+        if columns.size:
+            rows = np.ascontiguousarray(data[:, columns].T)
+            resampled[:, columns] = _resample_rows_kernel(rows, x, x_new).T
+        return resampled
+
+else:
+    _resample_columns_jit = None
+
 def preprocess_landmarks(landmarks, target_frames=190, sigma=1.0, threshold=3.0):
+    landmarks = np.ascontiguousarray(landmarks, dtype=np.float32)
     original_frames, keypoints, coords = landmarks.shape
     if original_frames == 0:
         raise ValueError("Zero frames detected")
@@ -120,36 +242,17 @@ def preprocess_landmarks(landmarks, target_frames=190, sigma=1.0, threshold=3.0)
     if original_frames >= target_frames:
         landmarks = landmarks[:target_frames]
     else:
-        x = np.linspace(0, 1, original_frames)
-        x_new = np.linspace(0, 1, target_frames)
-        interpolated = np.zeros((target_frames, keypoints, coords))
-        for k in range(keypoints):
-            for c in range(coords):
-                if np.all(np.isnan(landmarks[:, k, c])) or np.all(landmarks[:, k, c] == 0):
-                    interpolated[:, k, c] = np.nan
-                else:
-                    interp_func = interp1d(x, landmarks[:, k, c], kind='linear', fill_value='extrapolate', bounds_error=False)
-                    interpolated[:, k, c] = interp_func(x_new)
-        landmarks = interpolated
-    smoothed = np.zeros_like(landmarks)
-    for k in range(keypoints):
-        for c in range(coords):
-            if not np.all(np.isnan(landmarks[:, k, c])):
-                smoothed[:, k, c] = gaussian_filter1d(landmarks[:, k, c], sigma=sigma, mode='nearest')
+        data = landmarks.reshape(original_frames, -1)
+        # all-NaN and all-zero (undetected) columns stay NaN
+        valid_columns = np.flatnonzero(~(np.isnan(data).all(axis=0) | (data == 0).all(axis=0)))
+        resample = _resample_columns_jit if _resample_columns_jit is not None else _resample_columns
+        landmarks = resample(data, target_frames, valid_columns).reshape(target_frames, keypoints, coords)
+    smoothed = gaussian_filter1d(landmarks, sigma=sigma, axis=0, mode='nearest')
+    smoothed[:, np.all(np.isnan(landmarks), axis=0)] = np.nan
     z_scores = np.abs((smoothed - np.nanmean(smoothed, axis=0)) / np.nanstd(smoothed, axis=0))
     mask = (z_scores < threshold) | np.isnan(z_scores)
     cleaned = np.where(mask, smoothed, np.nan)
-    for k in range(keypoints):
-        for c in range(coords):
-            mask_nan = np.isnan(cleaned[:, k, c])
-            if np.any(mask_nan):
-                x = np.arange(target_frames)
-                valid_idx = ~mask_nan
-                if np.any(valid_idx):
-                    interp_func = interp1d(x[valid_idx], cleaned[valid_idx, k, c], kind='linear', fill_value='extrapolate')
-                    cleaned[:, k, c] = interp_func(x)
-                else:
-                    cleaned[:, k, c] = 0
+    cleaned = _fill_nan_linear(cleaned.reshape(cleaned.shape[0], -1)).reshape(cleaned.shape)
     if cleaned.shape[0] != target_frames or cleaned.shape[1] != 543 or cleaned.shape[2] != 3:
         raise ValueError(f"Output shape mismatch: {cleaned.shape}, expected {(target_frames, 543, 3)}")
     return cleaned
@@ -174,17 +277,10 @@ def process_all_landmarks(landmark_dir, dataset_csv):
         output_pkl = folder_path / 'landmarks_complete_processed.pkl'
         if complete_pkl.exists():
             try:
-                with open(complete_pkl, 'rb') as f:
-                    landmarks_complete = pickle.load(f)
-                if isinstance(landmarks_complete, dict):
-                    landmarks_complete = np.concatenate([
-                        np.array(landmarks_complete.get('face', np.zeros((57, 468, 3)))),
-                        np.array(landmarks_complete.get('left_hand', np.zeros((57, 21, 3)))),
-                        np.array(landmarks_complete.get('right_hand', np.zeros((57, 21, 3)))),
-                        np.array(landmarks_complete.get('pose', np.zeros((57, 33, 3))))
-                    ], axis=1)
-                elif not isinstance(landmarks_complete, np.ndarray):
+                landmarks_complete = pickle.loads(complete_pkl.read_bytes())
+                if not isinstance(landmarks_complete, (dict, np.ndarray)):
                     raise ValueError(f"Unexpected format in {complete_pkl}")
+                landmarks_complete = _dict_to_ndarray(landmarks_complete)
                 processed_landmarks = preprocess_landmarks(landmarks_complete, target_frames=190)
                 os.makedirs(folder_path, exist_ok=True)
                 with open(output_pkl, 'wb') as f:
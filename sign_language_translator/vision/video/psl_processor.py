@@ -1,15 +1,61 @@
+import os
+import queue
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
+from operator import attrgetter
+
 import cv2
 import mediapipe as mp
 import numpy as np
-from typing import List, Tuple, Dict, Any
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 from pathlib import Path
 
+try:
+    import numba
+except ImportError:
+    numba = None
+
+# number of landmarks in each holistic landmark group, in packing and presence-mask order
+LANDMARK_COUNTS = {
+    'pose_landmarks': 33,
+    'left_hand_landmarks': 21,
+    'right_hand_landmarks': 21,
+    'face_landmarks': 468,
+}
+N_LANDMARKS = sum(LANDMARK_COUNTS.values())
+
+# position of each group along the landmark axis of the packed (pose|lhand|rhand|face) array
+LANDMARK_SLICES = {}
+_offset = 0
+for _name, _count in LANDMARK_COUNTS.items():
+    LANDMARK_SLICES[_name] = slice(_offset, _offset + _count)
+    _offset += _count
+del _offset, _name, _count
+
+# reads (x, y, z) off a landmark proto in one C-level call
+_get_xyz = attrgetter('x', 'y', 'z')
+
 class PSLVideoProcessor:
     """
     A class for processing PSL (Pakistani Sign Language) videos and extracting features.
+
+    One instance keeps a single holistic graph alive and can process any number of
+    videos; reuse it instead of constructing a new processor per video. Use it as a
+    context manager (or call ``close()``) to release the graph when done.
     """
     
-    def __init__(self):
+    def __init__(self, warmup: bool = True, landmark_dtype=np.float16):
+        """
+        Args:
+            warmup (bool): Run the holistic graph once on a blank frame so its lazy
+                delegate/graph initialization happens here instead of on the first
+                real video frame. Defaults to True.
+            landmark_dtype: dtype used to store extracted landmarks. Defaults to float16,
+                which is well below MediaPipe's own jitter for normalized coordinates and
+                quarters the memory of float64; ``preprocess_features`` upcasts once per clip.
+        """
+        self.landmark_dtype = np.dtype(landmark_dtype)
         # Initialize MediaPipe solutions
         self.mp_holistic = mp.solutions.holistic
         self.holistic = self.mp_holistic.Holistic(
@@ -19,68 +65,279 @@ class PSLVideoProcessor:
         
         # Initialize drawing utilities
         self.mp_drawing = mp.solutions.drawing_utils
+
+        if warmup:
+            self.holistic.process(np.zeros((480, 640, 3), dtype=np.uint8))
+
+    def close(self) -> None:
+        """Release the native resources held by the MediaPipe holistic graph."""
+        self.holistic.close()
+
+    def __enter__(self) -> "PSLVideoProcessor":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
         
-    def process_video(self, video_path: str) -> List[Dict[str, Any]]:
+    def process_video(
+        self,
+        video_path: str,
+        prefetch: int = 8,
+        target_width: Optional[int] = 640,
+        stride: int = 1,
+        motion_threshold: Optional[float] = None,
+    ) -> Dict[str, np.ndarray]:
         """
         Process a PSL video and extract features from each frame.
+
+        All landmarks are packed into one contiguous ``(n_frames, 543, 3)``
+        ``landmark_dtype`` array under ``'landmarks'`` (pose | left hand | right hand |
+        face, see ``LANDMARK_SLICES``; zeros where a group was not detected), with a
+        ``(n_frames, 4)`` boolean ``'presence'`` mask whose columns follow
+        ``LANDMARK_COUNTS``. Each group is also available under its own key as a
+        zero-copy view into the packed array.
+
+        Frames are decoded and converted to RGB on a background reader thread while
+        the holistic model runs on the calling thread, so decoding overlaps inference.
         
         Args:
             video_path (str): Path to the video file
+            prefetch (int): Maximum number of decoded frames buffered ahead of inference
+            target_width (int, optional): Frames wider than this are downscaled to it
+                (keeping aspect ratio) before inference. Landmarks are normalized to the
+                frame size so they are unaffected. ``None`` disables resizing.
+            stride (int): Process every ``stride``-th frame, at least 1. Skipped frames
+                are only grabbed from the container, never decoded to pixels.
+            motion_threshold (float, optional): If the mean absolute difference (0-255)
+                between a 64x64 thumbnail of a frame and of the last frame that went
+                through the holistic model is below this, the previous landmarks are
+                reused instead of running the model again (pauses and holds are common
+                in sign videos). Off by default: reused landmarks change the features
+                a model sees, so only enable it (e.g. ``2.0``) where that is acceptable.
+                ``None`` or ``0`` runs the model on every frame.
             
         Returns:
-            List[Dict[str, Any]]: List of features extracted from each frame
+            Dict[str, np.ndarray]: Packed landmarks, presence mask and per-group views
+
+        Raises:
+            ValueError: If ``stride`` is less than 1
         """
-        cap = cv2.VideoCapture(video_path)
-        features = []
-        
-        while cap.isOpened():
-            ret, frame = cap.read()
-            if not ret:
-                break
-                
-            # Convert the BGR image to RGB
-            rgb_frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
-            
-            # Process the frame and get the results
-            results = self.holistic.process(rgb_frame)
-            
-            # Extract features from the results
-            frame_features = self._extract_features(results)
-            features.append(frame_features)
-            
-        cap.release()
+        self._check_stride(stride)
+        cap = self._open_video(video_path)
+        estimated_frames = max(int(cap.get(cv2.CAP_PROP_FRAME_COUNT)), 0)
+        features = self._allocate_features(-(-estimated_frames // stride))
+        n_frames = 0
+        for results in self._iter_results(cap, prefetch, target_width, stride, motion_threshold):
+            if n_frames == len(features['presence']):
+                # container frame counts are estimates, grow if the video is longer
+                features = self._allocate_features(max(2 * n_frames, 16), features)
+            self._extract_features(results, features, n_frames)
+            n_frames += 1
+        return self._with_group_views({name: array[:n_frames] for name, array in features.items()})
+
+    def iter_features(
+        self,
+        video_path: str,
+        prefetch: int = 8,
+        target_width: Optional[int] = 640,
+        stride: int = 1,
+        motion_threshold: Optional[float] = None,
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """
+        Lazily extract features frame by frame, keeping memory use constant in the
+        video length. Arguments are the same as ``process_video``.
+
+        Yields:
+            Dict[str, np.ndarray]: the frame's packed ``(543, 3)`` ``'landmarks'``, its
+            ``(4,)`` ``'presence'`` mask and per-group views, as in ``process_video``.
+
+        Raises:
+            ValueError: If ``stride`` is less than 1 (when called, not on first iteration)
+        """
+        # validated here rather than in the generator, where the error would only
+        # surface once iteration starts
+        self._check_stride(stride)
+        return self._iter_features(video_path, prefetch, target_width, stride, motion_threshold)
+
+    def _iter_features(
+        self,
+        video_path: str,
+        prefetch: int,
+        target_width: Optional[int],
+        stride: int,
+        motion_threshold: Optional[float],
+    ) -> Iterator[Dict[str, np.ndarray]]:
+        """Generator behind ``iter_features``."""
+        cap = self._open_video(video_path)
+        for results in self._iter_results(cap, prefetch, target_width, stride, motion_threshold):
+            features = self._allocate_features(1)
+            self._extract_features(results, features, 0)
+            yield self._with_group_views({name: array[0] for name, array in features.items()})
+
+    @staticmethod
+    def _check_stride(stride: int) -> None:
+        # a zero stride would otherwise raise ZeroDivisionError on the reader thread,
+        # which just ends the stream with no frames
+        if stride < 1:
+            raise ValueError(f"stride must be at least 1, got {stride}")
+
+    @staticmethod
+    def _open_video(video_path: str):
+        cap = cv2.VideoCapture(video_path, cv2.CAP_FFMPEG)
+        if not cap.isOpened():
+            # OpenCV builds without the FFmpeg backend: let OpenCV choose one
+            cap.release()
+            cap = cv2.VideoCapture(video_path)
+        cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+        return cap
+
+    def _iter_results(
+        self,
+        cap,
+        prefetch: int,
+        target_width: Optional[int],
+        stride: int,
+        motion_threshold: Optional[float] = None,
+    ) -> Iterator[Any]:
+        """Yield holistic results for the frames of ``cap``, decoded on a reader thread.
+        The reader is stopped and ``cap`` released when iteration ends or is abandoned;
+        an error raised while decoding is re-raised here."""
+        frames = queue.Queue(maxsize=max(prefetch, 1))
+        stop = threading.Event()
+        reader = threading.Thread(
+            target=self._read_frames,
+            args=(cap, frames, stop, target_width, stride, bool(motion_threshold)),
+            daemon=True,
+        )
+        reader.start()
+        try:
+            # the holistic graph is stateful and not thread-safe, so it stays on this thread
+            results = None
+            last_thumbnail = None
+            while (item := frames.get()) is not None:
+                if isinstance(item, Exception):
+                    raise item
+                rgb_frame, thumbnail = item
+                if thumbnail is not None:
+                    if (
+                        last_thumbnail is not None
+                        and cv2.absdiff(thumbnail, last_thumbnail).mean() < motion_threshold
+                    ):
+                        # (nearly) static frame: reuse the last inferred landmarks
+                        yield results
+                        continue
+                    last_thumbnail = thumbnail
+                results = self.holistic.process(rgb_frame)
+                yield results
+        finally:
+            stop.set()
+            reader.join()
+            cap.release()
+
+    def _allocate_features(
+        self, n_frames: int, existing: Optional[Dict[str, np.ndarray]] = None
+    ) -> Dict[str, np.ndarray]:
+        """Allocate zeroed packed landmarks and presence arrays for ``n_frames`` frames,
+        copying over the rows of ``existing`` if given."""
+        features = {
+            'landmarks': np.zeros((n_frames, N_LANDMARKS, 3), dtype=self.landmark_dtype),
+            'presence': np.zeros((n_frames, len(LANDMARK_COUNTS)), dtype=bool),
+        }
+        if existing is not None:
+            for name, array in existing.items():
+                features[name][: len(array)] = array
         return features
+
+    @staticmethod
+    def _with_group_views(features: Dict[str, np.ndarray]) -> Dict[str, np.ndarray]:
+        """Add a view of each landmark group of the packed ``'landmarks'`` array."""
+        landmarks = features['landmarks']
+        for name, group in LANDMARK_SLICES.items():
+            features[name] = landmarks[..., group, :]
+        return features
+
+    def _read_frames(
+        self,
+        cap,
+        frames: queue.Queue,
+        stop: threading.Event,
+        target_width: Optional[int] = None,
+        stride: int = 1,
+        thumbnails: bool = False,
+    ) -> None:
+        """Decode frames from ``cap`` into ``frames`` as C-contiguous, 64-byte aligned RGB
+        buffers, paired with a 64x64 thumbnail if ``thumbnails`` (else ``None``), and end
+        with a ``None`` sentinel, or with the exception that stopped decoding."""
+
+        def put(item) -> bool:
+            while not stop.is_set():
+                try:
+                    frames.put(item, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        size = None
+        frame_index = 0
+        # ring of reusable RGB buffers: up to maxsize frames can sit in the queue while one
+        # is being inferred and one is being written, so maxsize + 2 buffers never overlap
+        rgb_buffers = []
+        n_emitted = 0
+        end = None
+        try:
+            while cap.isOpened():
+                if not cap.grab():
+                    break
+                frame_index += 1
+                if (frame_index - 1) % stride:
+                    continue
+                ret, frame = cap.retrieve()
+                if not ret:
+                    break
+                if size is None and target_width and frame.shape[1] > target_width:
+                    scale = target_width / frame.shape[1]
+                    size = (target_width, round(frame.shape[0] * scale))
+                if size is not None:
+                    frame = cv2.resize(frame, size, interpolation=cv2.INTER_AREA)
+                if not rgb_buffers or rgb_buffers[0].shape != frame.shape:
+                    rgb_buffers = [
+                        _aligned_empty(frame.shape, frame.dtype) for _ in range(frames.maxsize + 2)
+                    ]
+                rgb_frame = rgb_buffers[n_emitted % len(rgb_buffers)]
+                cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=rgb_frame)
+                thumbnail = (
+                    cv2.resize(rgb_frame, (64, 64), interpolation=cv2.INTER_AREA)
+                    if thumbnails
+                    else None
+                )
+                if not put((rgb_frame, thumbnail)):
+                    break
+                n_emitted += 1
+        except Exception as error:
+            # raised on this thread it would only end the stream early, so hand it to
+            # the consumer instead
+            end = error
+        finally:
+            put(end)
     
-    def _extract_features(self, results) -> Dict[str, Any]:
+    def _extract_features(self, results, features: Dict[str, np.ndarray], index: int) -> None:
         """
-        Extract relevant features from MediaPipe results.
+        Write the landmarks of one frame's MediaPipe results into row ``index``
+        of the packed landmarks array. Undetected groups are left as zeros.
         
         Args:
             results: MediaPipe holistic results
-            
-        Returns:
-            Dict[str, Any]: Dictionary containing extracted features
+            features (Dict[str, np.ndarray]): Arrays from ``_allocate_features``
+            index (int): Frame index to write
         """
-        features = {
-            'pose_landmarks': None,
-            'left_hand_landmarks': None,
-            'right_hand_landmarks': None,
-            'face_landmarks': None
-        }
-        
-        if results.pose_landmarks:
-            features['pose_landmarks'] = self._landmarks_to_array(results.pose_landmarks)
-            
-        if results.left_hand_landmarks:
-            features['left_hand_landmarks'] = self._landmarks_to_array(results.left_hand_landmarks)
-            
-        if results.right_hand_landmarks:
-            features['right_hand_landmarks'] = self._landmarks_to_array(results.right_hand_landmarks)
-            
-        if results.face_landmarks:
-            features['face_landmarks'] = self._landmarks_to_array(results.face_landmarks)
-            
-        return features
+        frame = features['landmarks'][index]
+        presence = features['presence'][index]
+        for column, (name, group) in enumerate(LANDMARK_SLICES.items()):
+            landmarks = getattr(results, name)
+            if landmarks:
+                frame[group] = self._landmarks_to_array(landmarks)
+                presence[column] = True
     
     def _landmarks_to_array(self, landmarks) -> np.ndarray:
         """
@@ -90,24 +347,137 @@ class PSLVideoProcessor:
             landmarks: MediaPipe landmarks
             
         Returns:
-            np.ndarray: Array of landmark coordinates
+            np.ndarray: ``(n_landmarks, 3)`` float32 array of landmark coordinates
         """
-        return np.array([[lm.x, lm.y, lm.z] for lm in landmarks.landmark])
+        points = landmarks.landmark
+        return np.fromiter(
+            chain.from_iterable(map(_get_xyz, points)),
+            dtype=np.float32,
+            count=3 * len(points),
+        ).reshape(-1, 3)
     
-    def preprocess_features(self, features: List[Dict[str, Any]]) -> np.ndarray:
+    def preprocess_features(self, features: Dict[str, np.ndarray], window: int = 5) -> np.ndarray:
         """
         Preprocess the extracted features for model input.
+
+        The packed landmarks are viewed as one ``(n_frames, 543 * 3)`` matrix,
+        smoothed over time with a centered moving average of ``window`` frames
+        (edges are clamped) and z-score normalized per coordinate channel. Channels
+        that do not vary over the clip are set to 0. Uses a fused Numba kernel when
+        ``numba`` is installed and an equivalent NumPy implementation otherwise.
         
         Args:
-            features (List[Dict[str, Any]]): List of features from each frame
+            features (Dict[str, np.ndarray]): Output of ``process_video``
+            window (int): Temporal smoothing window in frames (rounded up to an odd number)
             
         Returns:
-            np.ndarray: Preprocessed features ready for model input
+            np.ndarray: ``(n_frames, 1629)`` float32 features ready for model input
         """
-        # TODO: Implement feature preprocessing
-        # This could include:
-        # - Normalization
-        # - Temporal smoothing
-        # - Feature selection
-        # - Dimensionality reduction
-        pass 
\ No newline at end of file
+        landmarks = features['landmarks']
+        # explicit width: a 0-frame clip can't infer a -1 dimension
+        data = landmarks.reshape(len(landmarks), N_LANDMARKS * 3).astype(np.float32, copy=False)
+        half_window = max(int(window), 1) // 2
+        if len(data) == 0:
+            return data
+        if _smooth_and_normalize_jit is not None:
+            return _smooth_and_normalize_jit(data, half_window)
+        return _smooth_and_normalize(data, half_window)
+
+
+def _aligned_empty(shape, dtype, alignment: int = 64) -> np.ndarray:
+    """Allocate an uninitialized C-contiguous array whose data starts on an
+    ``alignment``-byte boundary, so MediaPipe can ingest it without copying."""
+    dtype = np.dtype(dtype)
+    n_bytes = int(np.prod(shape)) * dtype.itemsize
+    raw = np.empty(n_bytes + alignment, dtype=np.uint8)
+    offset = -raw.ctypes.data % alignment
+    return raw[offset : offset + n_bytes].view(dtype).reshape(shape)
+
+
+def process_videos(
+    video_paths: Iterable[str], max_workers: Optional[int] = None, **process_kwargs
+) -> List[Dict[str, np.ndarray]]:
+    """
+    Extract features from several videos concurrently.
+
+    Each worker thread gets its own ``PSLVideoProcessor`` (holistic graphs are stateful
+    and must not be shared) and reuses it for every video it handles. MediaPipe
+    releases the GIL during inference so the threads run in parallel.
+
+    Args:
+        video_paths (Iterable[str]): Paths of the videos to process
+        max_workers (int, optional): Number of worker threads. Defaults to the CPU count.
+        **process_kwargs: Forwarded to ``PSLVideoProcessor.process_video``
+
+    Returns:
+        List[Dict[str, np.ndarray]]: ``process_video`` output for each path, in order
+    """
+    video_paths = list(video_paths)
+    if not video_paths:
+        return []
+    local = threading.local()
+    processors = []
+    lock = threading.Lock()
+
+    def process(video_path: str) -> Dict[str, np.ndarray]:
+        processor = getattr(local, 'processor', None)
+        if processor is None:
+            processor = local.processor = PSLVideoProcessor()
+            with lock:
+                processors.append(processor)
+        return processor.process_video(video_path, **process_kwargs)
+
+    n_workers = min(len(video_paths), max_workers or os.cpu_count() or 1)
+    try:
+        with ThreadPoolExecutor(max_workers=n_workers) as executor:
+            return list(executor.map(process, video_paths))
+    finally:
+        for processor in processors:
+            processor.close()
+
+
+def _smooth_and_normalize(data: np.ndarray, half_window: int) -> np.ndarray:
+    """Edge-clamped centered moving average along axis 0 followed by a per-column z-score."""
+    window = 2 * half_window + 1
+    padded = np.pad(data, ((half_window, half_window), (0, 0)), mode='edge').astype(np.float64)
+    cumulative = np.zeros((len(padded) + 1, data.shape[1]))
+    np.cumsum(padded, axis=0, out=cumulative[1:])
+    smoothed = (cumulative[window:] - cumulative[:-window]) / window
+    mean = smoothed.mean(axis=0)
+    std = smoothed.std(axis=0)
+    scale = np.divide(1.0, std, out=np.zeros_like(std), where=std > 1e-8)
+    return ((smoothed - mean) * scale).astype(np.float32)
+
+
+if numba is not None:
+
+    @numba.njit(parallel=True, cache=True, fastmath=True)
+    def _smooth_and_normalize_kernel(channels, half_window):
+        # channels is (n_channels, n_frames) so each channel is a contiguous row
+        n_channels, n_frames = channels.shape
+        window = 2 * half_window + 1
+        out = np.empty((n_frames, n_channels), dtype=np.float32)
+        for j in numba.prange(n_channels):
+            row = channels[j]
+            smoothed = np.empty(n_frames)
+            # running-sum moving average with clamped edges
+            total = 0.0
+            for k in range(-half_window, half_window + 1):
+                total += row[min(max(k, 0), n_frames - 1)]
+            for t in range(n_frames):
+                smoothed[t] = total / window
+                total += row[min(t + half_window + 1, n_frames - 1)]
+                total -= row[max(t - half_window, 0)]
+            mean = smoothed.mean()
+            std = np.sqrt(((smoothed - mean) ** 2).mean())
+            scale = 1.0 / std if std > 1e-8 else 0.0
+            for t in range(n_frames):
+                out[t, j] = (smoothed[t] - mean) * scale
+        return out
+
+    def _smooth_and_normalize_jit(data: np.ndarray, half_window: int) -> np.ndarray:
+        """Numba version of ``_smooth_and_normalize``, fusing smoothing and z-score per channel."""
+        return _smooth_and_normalize_kernel(np.ascontiguousarray(data.T), half_window)
+
+else:
+    _smooth_and_normalize_jit = None
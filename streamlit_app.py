@@ -1,4 +1,8 @@
 import streamlit as st
+import base64
+import hashlib
+import io
+import logging
 import os
 import sys
 from pathlib import Path
@@ -6,14 +10,32 @@ import cv2
 import numpy as np
 from PIL import Image
 import tempfile
-import subprocess
-import importlib.util
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
 
-# Check Python version first
-python_version = sys.version_info
-st.sidebar.info(f"🐍 Python Version: {python_version.major}.{python_version.minor}.{python_version.micro}")
+try:
+    import torch
+except ImportError:
+    torch = None
+try:
+    import av
+except ImportError:
+    av = None
+try:
+    from av.codec.hwaccel import HWAccel
+except ImportError:
+    HWAccel = None
+try:
+    from sign_language_translator.models.sign_to_text import PSLSignToTextModel, WLASLSignToTextModel
+    from sign_language_translator.models.text_to_sign import ConcatenativeSynthesis, WLASLConcatenativeSynthesis
+except ImportError:
+    PSLSignToTextModel = WLASLSignToTextModel = None
+    ConcatenativeSynthesis = WLASLConcatenativeSynthesis = None
 
-# Page configuration
+# Page configuration (must be the first Streamlit command)
 st.set_page_config(
     page_title="Sign Language Translator",
     page_icon="🤟",
@@ -21,6 +43,10 @@ st.set_page_config(
     initial_sidebar_state="expanded"
 )
 
+# Check Python version
+python_version = sys.version_info
+st.sidebar.info(f"🐍 Python Version: {python_version.major}.{python_version.minor}.{python_version.micro}")
+
 # Initialize session state
 if 'models_initialized' not in st.session_state:
     st.session_state.models_initialized = False
@@ -28,22 +54,155 @@ if 'package_available' not in st.session_state:
     st.session_state.package_available = False
 if 'demo_mode' not in st.session_state:
     st.session_state.demo_mode = True
+# language -> loaded model, filled by initialize_models()
+if 's2t' not in st.session_state:
+    st.session_state.s2t = {}
+if 't2s' not in st.session_state:
+    st.session_state.t2s = {}
+# video hash -> decoded frames, least recently used first
+if 'decoded_frames' not in st.session_state:
+    st.session_state.decoded_frames = OrderedDict()
 
-# Check if sign_language_translator package is available
+# Environment probes run once per process. Streamlit re-executes this script on every
+# rerun, so plain module-level constants would be recomputed on each interaction.
+@st.cache_resource
 def check_package_availability():
+    return ConcatenativeSynthesis is not None
+
+@st.cache_resource
+def check_ffmpeg():
+    return shutil.which('ffmpeg') is not None
+
+PSL_S2T_MODEL_PATH = "sign_language_model_best.pth"
+WLASL_S2T_MODEL_PATH = "wlasl_vit_transformer.pth"
+
+@st.cache_resource
+def configure_torch():
+    # process-wide backend flags, set once; autograd is disabled per call by the models'
+    # inference_mode since torch.set_grad_enabled is thread-local and Streamlit reruns on other threads
+    torch.set_float32_matmul_precision("high")
+
+@st.cache_resource
+def get_device():
+    return "cuda" if torch is not None and torch.cuda.is_available() else "cpu"
+
+def _read_discard(path, chunk_size=16 * 1024 * 1024):
+    with open(path, 'rb') as f:
+        while f.read(chunk_size):
+            pass
+
+@st.cache_resource
+def warm_model_files():
+    # read the weight files concurrently so the torch.load calls that follow hit the page cache
+    paths = [p for p in (PSL_S2T_MODEL_PATH, WLASL_S2T_MODEL_PATH) if os.path.exists(p)]
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        list(pool.map(_read_discard, paths))
+
+# dummy clips in the format the page hands to predict, used to warm compiled models.
+# Two lengths: the second makes dynamo recompile with only the frame count symbolic.
+# That only helps networks that accept any clip length; one whose fully connected input
+# pins the clip shape (like the PSL CNN) can't run these clips and is left uncompiled.
+WARMUP_FRAME = np.zeros((64, 64, 3), dtype=np.uint8)
+WARMUP_CLIP_LENGTHS = (30, 45)
+
+def compile_model(model):
+    """Swap the network for a torch.compile'd version and pay the compile cost at load time.
+
+    Only done on CUDA, where CUDA graphs ("reduce-overhead") help. The eager network
+    is kept (and the error logged) if compilation or the warm-up forward fails.
+    """
+    if model.device != "cuda" or not hasattr(torch, "compile"):
+        return model
+    eager = model.model
+    model.model = torch.compile(eager, mode="reduce-overhead", fullgraph=False)
     try:
-        import importlib.metadata
-        importlib.metadata.version("sign_language_translator")
-        return True
+        for n_frames in WARMUP_CLIP_LENGTHS:
+            model.predict([WARMUP_FRAME] * n_frames)
     except Exception:
-        return False
+        logging.warning("torch.compile warm-up failed for %s, keeping the eager network",
+                        type(model).__name__, exc_info=True)
+        model.model = eager
+    return model
 
-def check_ffmpeg():
+def quantize_for_cpu(model):
+    """Dynamically quantize the Linear and LSTM layers to INT8 when running on CPU.
+
+    Weights are quantized once at load; activations are quantized on the fly, so no
+    calibration data is needed. The FP32 network is kept (and the error logged) if
+    quantization is unavailable.
+    """
+    if model.device != "cpu":
+        return model
     try:
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+        model.model = torch.ao.quantization.quantize_dynamic(
+            model.model, {torch.nn.Linear, torch.nn.LSTM}, dtype=torch.qint8
+        )
+    except Exception:
+        logging.warning("INT8 quantization failed for %s, keeping the FP32 network",
+                        type(model).__name__, exc_info=True)
+    return model
+
+# Models are cached per process so every session and rerun shares one copy of the weights
+@st.cache_resource
+def get_psl_s2t():
+    if not os.path.exists(PSL_S2T_MODEL_PATH):
+        return None
+    model = PSLSignToTextModel(device=get_device())
+    model.load_model(PSL_S2T_MODEL_PATH)
+    # channels-last conv weights (and INT8 fc layers on CPU); predict autocasts to FP16 on CUDA.
+    # Not torch.compile'd: its first Linear layer takes exactly 5120 features, which no
+    # clip of 64x64 frames produces, so compile_model's warm-up could only fail.
+    model.prepare_for_inference()
+    return model
+
+@st.cache_resource
+def get_wlasl_s2t():
+    if not os.path.exists(WLASL_S2T_MODEL_PATH):
+        return None
+    model = WLASLSignToTextModel.load(WLASL_S2T_MODEL_PATH, device=get_device())
+    if model.device == "cuda":
+        model.model.conv_layers.to(memory_format=torch.channels_last)
+    return compile_model(quantize_for_cpu(model))
+
+@st.cache_resource
+def get_psl_t2s():
+    return ConcatenativeSynthesis(
+        text_language="english",
+        sign_language="pakistan",
+        sign_format="video"
+    )
+
+@st.cache_resource
+def get_wlasl_t2s():
+    return WLASLConcatenativeSynthesis(
+        text_language="english",
+        sign_format="video"
+    )
+
+def _prewarm_models():
+    # a failing getter must not stop the others from warming; initialize_models()
+    # reports load failures when the user asks for the models
+    for getter in (warm_model_files, get_psl_s2t, get_wlasl_s2t, get_psl_t2s, get_wlasl_t2s):
+        try:
+            getter()
+        except Exception:
+            pass
+
+@st.cache_resource
+def start_model_prewarm():
+    # load the cached models in the background once per process, so the first
+    # "Initialize Models" click finds them already resident
+    thread = threading.Thread(target=_prewarm_models, daemon=True)
+    thread.start()
+    return thread
+
+def _load_model(name, getter, failures):
+    """Call a model getter, recording (name, error) in failures and returning None if it raises."""
+    try:
+        return getter()
+    except Exception as e:
+        failures.append((name, e))
+        return None
 
 def initialize_models():
     try:
@@ -55,36 +214,38 @@ def initialize_models():
             st.session_state.models_initialized = True
             return True
         try:
-            from sign_language_translator.models.sign_to_text import PSLSignToTextModel
-            from sign_language_translator.models.sign_to_text import WLASLSignToTextModel
-            from sign_language_translator.models.text_to_sign import ConcatenativeSynthesis
-            from sign_language_translator.models.text_to_sign import WLASLConcatenativeSynthesis
-            st.session_state.psl_sign_to_text_model = None
-            st.session_state.wlasl_sign_to_text_model = None
-            st.session_state.psl_text_to_sign_model = None
-            st.session_state.wlasl_text_to_sign_model = None
-            model_path = "sign_language_model_best.pth"
-            if os.path.exists(model_path):
-                st.session_state.psl_sign_to_text_model = PSLSignToTextModel()
-                st.session_state.psl_sign_to_text_model.load_model(model_path)
-            wlasl_model_path = "wlasl_vit_transformer.pth"
-            if os.path.exists(wlasl_model_path):
-                st.session_state.wlasl_sign_to_text_model = WLASLSignToTextModel()
-                st.session_state.wlasl_sign_to_text_model.load(wlasl_model_path)
-            st.session_state.psl_text_to_sign_model = ConcatenativeSynthesis(
-                text_language="english",
-                sign_language="pakistan",
-                sign_format="video"
+            warm_model_files()
+        except Exception:
+            # only a page-cache warm-up; the getters read the files themselves
+            pass
+        # each model loads independently, so one failure doesn't disable the others
+        failures = []
+        st.session_state.s2t = {
+            lang: model
+            for lang, model in (
+                ("PSL", _load_model("PSL sign-to-text", get_psl_s2t, failures)),
+                ("ASL", _load_model("ASL sign-to-text", get_wlasl_s2t, failures)),
             )
-            st.session_state.wlasl_text_to_sign_model = WLASLConcatenativeSynthesis(
-                text_language="english",
-                sign_format="video"
+            if model
+        }
+        st.session_state.t2s = {
+            lang: model
+            for lang, model in (
+                ("PSL", _load_model("PSL text-to-sign", get_psl_t2s, failures)),
+                ("ASL", _load_model("ASL text-to-sign", get_wlasl_t2s, failures)),
             )
+            if model
+        }
+        for name, error in failures:
+            st.warning(f"⚠️ {name} model loading failed: {error}")
+        if st.session_state.s2t or st.session_state.t2s:
             st.session_state.demo_mode = False
-            st.success("✅ Full models loaded successfully!")
-        except Exception as e:
-            st.warning(f"⚠️ Package available but model loading failed: {e}")
-            st.warning("⚠️ Falling back to demo mode")
+            if failures:
+                st.success("✅ Remaining models loaded successfully!")
+            else:
+                st.success("✅ Full models loaded successfully!")
+        else:
+            st.warning("⚠️ No model could be loaded, falling back to demo mode")
             st.session_state.demo_mode = True
         st.session_state.models_initialized = True
         return True
@@ -94,51 +255,217 @@ def initialize_models():
         st.session_state.models_initialized = True
         return False
 
-def translate_sign_to_text(video_input, source_lang="PSL"):
+def _open_container(path, hwaccel=False):
+    # NVDEC decode when requested and supported by the installed PyAV/FFmpeg, software otherwise
+    if hwaccel and HWAccel is not None:
+        try:
+            return av.open(path, hwaccel=HWAccel(device_type="cuda"))
+        except av.FFmpegError:
+            # the failed probe may have consumed part of an in-memory source
+            if hasattr(path, "seek"):
+                path.seek(0)
+    return av.open(path)
+
+def _decode_av(source, size, pix_fmt, hwaccel, stride):
+    with _open_container(source, hwaccel) as container:
+        stream = container.streams.video[0]
+        stream.thread_type = "AUTO"
+        for index, frame in enumerate(container.decode(stream)):
+            if index % stride:
+                continue
+            if size is not None:
+                frame = frame.reformat(width=size[0], height=size[1])
+            yield frame.to_ndarray(format=pix_fmt)
+
+def iter_frames(source, size=None, pix_fmt="rgb24", hwaccel=False, stride=1):
+    """Decode a video frame by frame.
+
+    Uses PyAV (bundled libav, threaded demuxing) when installed and falls back to OpenCV.
+    PyAV decodes in-memory bytes directly; OpenCV needs them spilled to a temporary file.
+
+    Args:
+        source: Path of the video file, or the encoded video bytes.
+        size: Optional (width, height) to resize every frame to.
+        pix_fmt: "rgb24" or "bgr24" channel order of the yielded uint8 frames.
+        hwaccel: Decode on the GPU with NVDEC when PyAV supports it, falling back to
+            software decoding if the GPU decoder fails.
+        stride: Yield every stride-th frame; skipped frames are decoded but never converted.
+    """
+    if av is not None:
+        if isinstance(source, bytes):
+            source = io.BytesIO(source)
+        n_yielded = 0
+        try:
+            for frame in _decode_av(source, size, pix_fmt, hwaccel, stride):
+                yield frame
+                n_yielded += 1
+        except av.FFmpegError:
+            if not hwaccel or HWAccel is None:
+                raise
+            # NVDEC errors mostly surface while decoding, not in av.open, so decode
+            # again in software, skipping the frames that were already yielded
+            if hasattr(source, "seek"):
+                source.seek(0)
+            yield from islice(_decode_av(source, size, pix_fmt, False, stride), n_yielded, None)
+        return
+    if isinstance(source, bytes):
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
+            tmp_file.write(source)
+        try:
+            yield from iter_frames(tmp_file.name, size, pix_fmt, stride=stride)
+        finally:
+            os.remove(tmp_file.name)
+        return
+    cap = cv2.VideoCapture(source)
     try:
-        if not st.session_state.demo_mode and st.session_state.package_available:
-            try:
-                if source_lang == "PSL" and st.session_state.psl_sign_to_text_model:
-                    result = st.session_state.psl_sign_to_text_model.predict(video_input)
-                    return result, 85
-                elif source_lang == "ASL" and st.session_state.wlasl_sign_to_text_model:
-                    result = st.session_state.wlasl_sign_to_text_model.predict(video_input)
-                    return result, 85
-            except Exception as e:
-                return f"Translation error: {str(e)}", 50
-        if source_lang == "PSL":
-            return "Translation: Hello, how are you? (PSL Demo Mode)", 85
-        elif source_lang == "ASL":
-            return "Translation: Hello, how are you? (ASL Demo Mode)", 85
-        else:
-            return "Translation: Video processed (Demo Mode)", 75
+        index = -1
+        while cap.grab():
+            index += 1
+            if index % stride:
+                continue
+            ret, frame = cap.retrieve()
+            if not ret:
+                break
+            if size is not None:
+                frame = cv2.resize(frame, size)
+            yield cv2.cvtColor(frame, cv2.COLOR_BGR2RGB) if pix_fmt == "rgb24" else frame
+    finally:
+        cap.release()
+
+# channel order each sign-to-text model expects for frame lists
+S2T_PIX_FMT = {"PSL": "rgb24", "ASL": "bgr24"}
+# (width, height) input size of both sign-to-text networks
+S2T_FRAME_SIZE = (64, 64)
+DECODED_FRAMES_CACHE_SIZE = 4
+
+def _stack_frames(frames, capacity=256):
+    """Write equally sized frames into one preallocated array, doubling it when full.
+
+    Avoids holding a list of per-frame arrays alongside the final np.stack copy.
+    """
+    buffer = None
+    n_frames = 0
+    for frame in frames:
+        if buffer is None:
+            buffer = np.empty((capacity, *frame.shape), dtype=frame.dtype)
+        elif n_frames == len(buffer):
+            buffer = np.concatenate([buffer, np.empty_like(buffer)])
+        buffer[n_frames] = frame
+        n_frames += 1
+    if buffer is None:
+        raise ValueError("No frames could be decoded from the video")
+    return buffer[:n_frames]
+
+def get_decoded_frames(video_hash, video_bytes, hwaccel=False):
+    """Decode an upload once per session into a (frames, height, width, 3) RGB array at model input size.
+
+    Kept in session_state so translating the same clip with another language or frame
+    stride skips decoding. Holds the DECODED_FRAMES_CACHE_SIZE most recently used clips.
+    """
+    cache = st.session_state.decoded_frames
+    if video_hash in cache:
+        cache.move_to_end(video_hash)
+        return cache[video_hash]
+    frames = _stack_frames(iter_frames(video_bytes, size=S2T_FRAME_SIZE, hwaccel=hwaccel))
+    cache[video_hash] = frames
+    while len(cache) > DECODED_FRAMES_CACHE_SIZE:
+        cache.popitem(last=False)
+    return frames
+
+DEMO_SIGN_TO_TEXT = {
+    "PSL": "Translation: Hello, how are you? (PSL Demo Mode)",
+    "ASL": "Translation: Hello, how are you? (ASL Demo Mode)",
+}
+
+# Errors propagate out of _sign_to_text/_text_to_sign so st.cache_data never stores them;
+# the public translate_* wrappers turn them into the error result shown to the user.
+def _sign_to_text(video_input, source_lang, model, frame_stride=1, video_hash=None):
+    if model is not None:
+        hwaccel = str(model.device).startswith("cuda")
+        if isinstance(video_input, bytes):
+            frames = get_decoded_frames(video_hash, video_input, hwaccel)[::frame_stride]
+            if S2T_PIX_FMT[source_lang] == "bgr24":
+                frames = frames[..., ::-1]
+            video_input = list(frames)
+        elif isinstance(video_input, str) and os.path.exists(video_input):
+            video_input = list(iter_frames(
+                video_input,
+                size=S2T_FRAME_SIZE,
+                pix_fmt=S2T_PIX_FMT[source_lang],
+                hwaccel=hwaccel,
+                stride=frame_stride,
+            ))
+        return model.predict(video_input), 85
+    if source_lang in DEMO_SIGN_TO_TEXT:
+        return DEMO_SIGN_TO_TEXT[source_lang], 85
+    return "Translation: Video processed (Demo Mode)", 75
+
+# Repeat requests for the same input are served from cache. use_model keys demo vs model
+# results; _model itself is left out of the key as the loaded models are process-wide singletons.
+# Videos are keyed on a digest computed once per request, so Streamlit does not rehash the bytes.
+@st.cache_data(show_spinner=False)
+def _cached_sign_to_text(video_hash, source_lang, frame_stride, use_model, _video_bytes, _model):
+    return _sign_to_text(_video_bytes, source_lang, _model, frame_stride, video_hash)
+
+# larger clips are handed to st.video instead; base64 inflates the payload by a third
+PREVIEW_INLINE_MAX_BYTES = 8 * 1024 * 1024
+
+@st.cache_data(show_spinner=False)
+def _video_data_url(video_hash, _video_bytes):
+    return "data:video/mp4;base64," + base64.b64encode(_video_bytes).decode()
+
+def upload_digest(uploaded_file):
+    """Digest of the full upload, computed once per uploaded file.
+    
+    It keys both the translation and the preview caches, and is kept in session_state
+    under the upload's id so reruns don't rehash the bytes.
+    """
+    upload_key = getattr(uploaded_file, 'file_id', None) or (uploaded_file.name, uploaded_file.size)
+    cached = st.session_state.get('_upload_digest')
+    if cached is not None and cached[0] == upload_key:
+        return cached[1]
+    digest = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+    st.session_state._upload_digest = (upload_key, digest)
+    return digest
+
+def show_video_preview(video_bytes, video_hash):
+    if len(video_bytes) > PREVIEW_INLINE_MAX_BYTES:
+        st.video(video_bytes)
+        return
+    data_url = _video_data_url(video_hash, video_bytes)
+    st.markdown(f'<video src="{data_url}" controls style="width: 100%"></video>', unsafe_allow_html=True)
+
+def translate_sign_to_text(video_input, source_lang="PSL", frame_stride=1, video_hash=None):
+    model = None if st.session_state.demo_mode else st.session_state.s2t.get(source_lang)
+    try:
+        if isinstance(video_input, bytes):
+            video_hash = video_hash or hashlib.blake2b(video_input, digest_size=16).hexdigest()
+            return _cached_sign_to_text(video_hash, source_lang, frame_stride, model is not None, video_input, model)
+        return _sign_to_text(video_input, source_lang, model, frame_stride)
     except Exception as e:
         return f"Translation error: {str(e)}", 50
 
+def _text_to_sign(text_input, target_lang, model):
+    if model is not None:
+        result = model.translate(text_input)
+        return f"Generated {target_lang} sign video for: '{text_input}'", 85
+    if target_lang in ("PSL", "ASL"):
+        return f"Generated {target_lang} sign video for: '{text_input}' (Demo Mode)", 85
+    return f"Text-to-sign translation (Demo Mode): '{text_input}'", 75
+
+@st.cache_data(show_spinner=False)
+def _cached_text_to_sign(text_input, target_lang, use_model, _model):
+    return _text_to_sign(text_input, target_lang, _model)
+
 def translate_text_to_sign(text_input, target_lang="PSL"):
+    model = None if st.session_state.demo_mode else st.session_state.t2s.get(target_lang)
     try:
-        if not st.session_state.demo_mode and st.session_state.package_available:
-            try:
-                if target_lang == "PSL" and st.session_state.psl_text_to_sign_model:
-                    result = st.session_state.psl_text_to_sign_model.translate(text_input)
-                    return f"Generated PSL sign video for: '{text_input}'", 85
-                elif target_lang == "ASL" and st.session_state.wlasl_text_to_sign_model:
-                    result = st.session_state.wlasl_text_to_sign_model.translate(text_input)
-                    return f"Generated ASL sign video for: '{text_input}'", 85
-            except Exception as e:
-                return f"Translation error: {str(e)}", 50
-        if target_lang == "PSL":
-            return f"Generated PSL sign video for: '{text_input}' (Demo Mode)", 85
-        elif target_lang == "ASL":
-            return f"Generated ASL sign video for: '{text_input}' (Demo Mode)", 85
-        else:
-            return f"Text-to-sign translation (Demo Mode): '{text_input}'", 75
+        return _cached_text_to_sign(text_input, target_lang, model is not None, model)
     except Exception as e:
         return f"Translation error: {str(e)}", 50
 
-def home_page():
+def home_page(package_available, ffmpeg_available):
     st.title("🤟 Sign Language Translator")
-    package_available = check_package_availability()
     if not package_available:
         st.warning("⚠️ sign_language_translator package not available - running in demo mode")
         st.info("🎭 **Demo Mode Active** - Using simulated translations for demonstration")
@@ -167,17 +494,22 @@ def home_page():
         st.metric("Package Available", "✅ Yes" if package_available else "❌ No")
         st.metric("Demo Mode", "✅ Active" if st.session_state.demo_mode else "❌ Disabled")
     with col2:
-        st.metric("FFMPEG", "✅ Available" if check_ffmpeg() else "❌ Not Available")
+        st.metric("FFMPEG", "✅ Available" if ffmpeg_available else "❌ Not Available")
         st.metric("Models Status", "✅ Loaded" if st.session_state.models_initialized else "❌ Not Loaded")
 
 def main():
-    if not check_ffmpeg():
+    package_available = check_package_availability()
+    if torch is not None:
+        configure_torch()
+    if package_available:
+        start_model_prewarm()
+    ffmpeg_available = check_ffmpeg()
+    if not ffmpeg_available and av is None:
         st.error("⚠️ FFMPEG is not installed. Some video features may not work properly.")
         st.info("To install FFMPEG, visit: https://ffmpeg.org/download.html")
     with st.sidebar:
         st.title("🤟 Sign Language Translator")
         st.markdown("---")
-        package_available = check_package_availability()
         if package_available:
             st.success("✅ Package Available")
         else:
@@ -186,22 +518,24 @@ def main():
         if st.button("🔄 Initialize Models", type="primary"):
             with st.spinner("Loading translation models..."):
                 initialize_models()
-        st.metric("Package Status", "✅ Available" if package_available else "❌ Not Available")
-        st.metric("Demo Mode", "✅ Active" if st.session_state.demo_mode else "❌ Disabled")
-        st.metric("Models Loaded", "✅ Yes" if st.session_state.models_initialized else "❌ No")
+        st.markdown(
+            f"**Package:** {'✅' if package_available else '❌'}  \n"
+            f"**Demo Mode:** {'✅' if st.session_state.demo_mode else '❌'}  \n"
+            f"**Models Loaded:** {'✅' if st.session_state.models_initialized else '❌'}"
+        )
         st.markdown("---")
     page = st.sidebar.selectbox(
         "Choose a page:",
         ["🏠 Home", "📝 Text to Sign", "🎥 Sign to Text", "ℹ️ About"]
     )
     if page == "🏠 Home":
-        home_page()
+        home_page(package_available, ffmpeg_available)
     elif page == "📝 Text to Sign":
         text_to_sign_page()
     elif page == "🎥 Sign to Text":
         sign_to_text_page()
     elif page == "ℹ️ About":
-        about_page()
+        about_page(package_available)
 
 def text_to_sign_page():
     st.header("📝 Text to Sign Language")
@@ -260,21 +594,28 @@ def sign_to_text_page():
             ["English", "Urdu", "Hindi"],
             index=0
         )
+    frame_stride = st.slider(
+        "Frame stride",
+        min_value=1,
+        max_value=5,
+        value=1,
+        help="Translate every n-th frame only. Higher values are faster but may miss quick signs."
+    )
     st.subheader("📹 Video Input")
     input_method = st.radio(
         "Choose input method:",
         ["Upload Video File", "Record Video", "Use Sample Video"]
     )
     video_input = None
+    video_hash = None
     if input_method == "Upload Video File":
         uploaded_file = st.file_uploader(
             "Upload a sign language video:",
             type=['mp4', 'avi', 'mov', 'mkv']
         )
         if uploaded_file is not None:
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                video_input = tmp_file.name
+            video_input = uploaded_file.getvalue()
+            video_hash = upload_digest(uploaded_file)
             st.success(f"✅ Video uploaded: {uploaded_file.name}")
     elif input_method == "Record Video":
         st.info("🎥 Video recording feature would be available here.")
@@ -288,7 +629,10 @@ def sign_to_text_page():
         if video_input:
             with st.spinner("Processing video and translating..."):
                 source_lang = "PSL" if "PSL" in source_sign_language else "ASL"
-                result, confidence = translate_sign_to_text(video_input, source_lang)
+                if not st.session_state.demo_mode and source_lang not in st.session_state.s2t:
+                    # its weights file is missing or failed to load (initialize_models reports failures)
+                    st.warning(f"⚠️ No {source_lang} sign-to-text model is loaded; showing a demo translation.")
+                result, confidence = translate_sign_to_text(video_input, source_lang, frame_stride, video_hash)
                 st.success("✅ Translation completed!")
                 col1, col2 = st.columns(2)
                 with col1:
@@ -298,6 +642,9 @@ def sign_to_text_page():
                     st.subheader("📊 Confidence Score")
                     st.metric("Confidence", f"{confidence}%")
                 st.subheader("🎥 Video Preview")
+                if isinstance(video_input, bytes):
+                    # same bytes the model decoded; the upload is read only once per rerun
+                    show_video_preview(video_input, video_hash)
                 if st.session_state.demo_mode:
                     st.info("🎭 Demo Mode: Video preview is simulated for demonstration purposes.")
                 else:
@@ -306,9 +653,8 @@ def sign_to_text_page():
         else:
             st.error("Please provide a video input first.")
 
-def about_page():
+def about_page(package_available):
     st.header("ℹ️ About")
-    package_available = check_package_availability()
     st.markdown("""
     ## Sign Language Translator
     This application provides translation services between text and sign languages, supporting:
@@ -1,12 +1,9 @@
 import streamlit as st
+import hashlib
 import os
 import sys
 from pathlib import Path
-import cv2
-import numpy as np
-from PIL import Image
-import tempfile
-import subprocess
+import shutil
 
 # Page configuration
 st.set_page_config(
@@ -17,18 +14,18 @@ st.set_page_config(
 )
 
 # Initialize session state
-if 'models_initialized' not in st.session_state:
-    st.session_state.models_initialized = False
-if 'demo_mode' not in st.session_state:
-    st.session_state.demo_mode = True
+for key, default in (('models_initialized', False), ('demo_mode', True)):
+    st.session_state.setdefault(key, default)
 
-def check_ffmpeg():
+# Widget interactions inside a fragment rerun only that fragment; st.fragment is
+# st.experimental_fragment before 1.37 and absent before 1.33, where pages fall back
+# to full-script reruns.
+fragment = getattr(st, 'fragment', None) or getattr(st, 'experimental_fragment', None) or (lambda func: func)
+
+@st.cache_resource(ttl="1h")
+def check_ffmpeg() -> bool:
     """Check if FFMPEG is available"""
-    try:
-        result = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True)
-        return result.returncode == 0
-    except FileNotFoundError:
-        return False
+    return shutil.which('ffmpeg') is not None
 
 def initialize_models():
     """Initialize models (demo mode)"""
@@ -40,38 +37,39 @@ def initialize_models():
         st.error(f"❌ Error initializing models: {e}")
         return False
 
-def translate_sign_to_text(video_input, source_lang="PSL"):
+# Demo-mode placeholder results: (template, confidence) per sign language
+_S2T_DEMO = {
+    "PSL": ("Translation: Hello, how are you? (PSL Demo Mode)", 85),
+    "ASL": ("Translation: Hello, how are you? (ASL Demo Mode)", 85),
+}
+_S2T_DEMO_DEFAULT = ("Translation: Video processed (Demo Mode)", 75)
+_T2S_DEMO = {
+    "PSL": ("Generated PSL sign video for: '{}' (Demo Mode)", 85),
+    "ASL": ("Generated ASL sign video for: '{}' (Demo Mode)", 85),
+}
+_T2S_DEMO_DEFAULT = ("Text-to-sign translation (Demo Mode): '{}'", 75)
+
+@st.cache_data(ttl="15m", max_entries=256, show_spinner=False)
+def _cached_sign_to_text(video_key, source_lang, demo_mode):
+    if not demo_mode:
+        return "Translation: Model not available", 50
+    return _S2T_DEMO.get(source_lang, _S2T_DEMO_DEFAULT)
+
+def translate_sign_to_text(video_input, source_lang="PSL", video_hash=None):
     """Translate sign language video to text (demo mode)"""
-    try:
-        if st.session_state.demo_mode:
-            # Demo mode - return placeholder text
-            if source_lang == "PSL":
-                return "Translation: Hello, how are you? (PSL Demo Mode)", 85
-            elif source_lang == "ASL":
-                return "Translation: Hello, how are you? (ASL Demo Mode)", 85
-            else:
-                return "Translation: Video processed (Demo Mode)", 75
-        else:
-            return "Translation: Model not available", 50
-    except Exception as e:
-        return f"Translation error: {str(e)}", 50
+    # uploads are keyed on their upload_digest, demo inputs on their name
+    video_key = video_hash or video_input
+    return _cached_sign_to_text(video_key, source_lang, st.session_state.demo_mode)
 
-def translate_text_to_sign(text_input, target_lang="PSL"):
+@st.cache_data(ttl="15m", max_entries=256, show_spinner=False)
+def translate_text_to_sign(text_input, target_lang="PSL", demo_mode=True):
     """Translate text to sign language (demo mode)"""
-    try:
-        if st.session_state.demo_mode:
-            # Demo mode - return placeholder text
-            if target_lang == "PSL":
-                return f"Generated PSL sign video for: '{text_input}' (Demo Mode)", 85
-            elif target_lang == "ASL":
-                return f"Generated ASL sign video for: '{text_input}' (Demo Mode)", 85
-            else:
-                return f"Text-to-sign translation (Demo Mode): '{text_input}'", 75
-        else:
-            return "Model not available", 50
-    except Exception as e:
-        return f"Translation error: {str(e)}", 50
+    if not demo_mode:
+        return "Model not available", 50
+    template, confidence = _T2S_DEMO.get(target_lang, _T2S_DEMO_DEFAULT)
+    return template.format(text_input), confidence
 
+@fragment
 def home_page():
     st.title("🤟 Sign Language Translator (Fallback Mode)")
     st.warning("⚠️ **Running in Fallback Mode** - The sign-language-translator package is not available. Using demo functionality.")
@@ -111,6 +109,18 @@ def home_page():
         st.metric("FFMPEG", "✅ Available" if check_ffmpeg() else "❌ Not Available")
         st.metric("Translation", "✅ Demo Mode")
 
+@fragment
+def model_status_sidebar():
+    # Model initialization section
+    st.subheader("🔧 Model Status")
+    if st.button("🔄 Initialize Models", type="primary"):
+        with st.spinner("Loading translation models..."):
+            initialize_models()
+    
+    # Show model status
+    st.metric("Demo Mode", "✅ Active")
+    st.metric("Translation", "✅ Demo Mode")
+
 def main():
     # Check FFMPEG
     if not check_ffmpeg():
@@ -122,70 +132,59 @@ def main():
         st.title("🤟 Sign Language Translator")
         st.markdown("---")
         
-        # Model initialization section
-        st.subheader("🔧 Model Status")
-        if st.button("🔄 Initialize Models", type="primary"):
-            with st.spinner("Loading translation models..."):
-                initialize_models()
-        
-        # Show model status
-        st.metric("Demo Mode", "✅ Active")
-        st.metric("Translation", "✅ Demo Mode")
+        model_status_sidebar()
         
         st.markdown("---")
     
     # Navigation
     page = st.sidebar.selectbox(
         "Choose a page:",
-        ["🏠 Home", "📝 Text to Sign", "🎥 Sign to Text", "ℹ️ About"]
+        list(PAGES)
     )
     
     # Display selected page
-    if page == "🏠 Home":
-        home_page()
-    elif page == "📝 Text to Sign":
-        text_to_sign_page()
-    elif page == "🎥 Sign to Text":
-        sign_to_text_page()
-    elif page == "ℹ️ About":
-        about_page()
+    PAGES[page]()
 
+@fragment
 def text_to_sign_page():
     st.header("📝 Text to Sign Language")
     
-    # Language selection
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        source_language = st.selectbox(
-            "Source Language",
-            ["English", "Urdu", "Hindi"],
-            index=0
-        )
-    
-    with col2:
-        target_sign_language = st.selectbox(
-            "Target Sign Language",
-            ["Pakistan Sign Language (PSL)", "American Sign Language (ASL)"],
-            index=0
+    # Inputs only apply on submit, so editing them does not rerun the page
+    with st.form(key="text_to_sign", clear_on_submit=False):
+        # Language selection
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            source_language = st.selectbox(
+                "Source Language",
+                ["English", "Urdu", "Hindi"],
+                index=0
+            )
+        
+        with col2:
+            target_sign_language = st.selectbox(
+                "Target Sign Language",
+                ["Pakistan Sign Language (PSL)", "American Sign Language (ASL)"],
+                index=0
+            )
+        
+        # Text input
+        text_input = st.text_area(
+            "Enter text to translate:",
+            placeholder="Type your text here...",
+            height=100
         )
+        
+        submitted = st.form_submit_button("🔄 Translate to Sign Language", type="primary")
     
-    # Text input
-    text_input = st.text_area(
-        "Enter text to translate:",
-        placeholder="Type your text here...",
-        height=100
-    )
-    
-    # Translate button
-    if st.button("🔄 Translate to Sign Language", type="primary"):
+    if submitted:
         if text_input.strip():
             with st.spinner("Translating..."):
                 # Map language selection to model parameter
                 target_lang = "PSL" if "PSL" in target_sign_language else "ASL"
                 
                 # Get translation
-                result, confidence = translate_text_to_sign(text_input, target_lang)
+                result, confidence = translate_text_to_sign(text_input, target_lang, st.session_state.demo_mode)
                 
                 # Display results
                 st.success("✅ Translation completed!")
@@ -206,67 +205,120 @@ def text_to_sign_page():
         else:
             st.error("Please enter some text to translate.")
 
+def upload_digest(uploaded_file):
+    """Digest of the full upload, computed once per uploaded file.
+    
+    Every rerun (and fragment rerun) hands back the same upload, so the digest is kept
+    in session_state under the upload's id instead of rehashing the bytes each time.
+    """
+    upload_key = getattr(uploaded_file, 'file_id', None) or (uploaded_file.name, uploaded_file.size)
+    cached = st.session_state.get('_upload_digest')
+    if cached is not None and cached[0] == upload_key:
+        return cached[1]
+    digest = hashlib.blake2b(uploaded_file.getbuffer(), digest_size=16).hexdigest()
+    st.session_state._upload_digest = (upload_key, digest)
+    return digest
+
+def save_uploaded_video(uploaded_file):
+    """Stream an upload to a temp file, removing the files left by earlier uploads.
+    
+    Fragment reruns hand back the same upload, so it is only copied again when it changes.
+    """
+    import tempfile  # only needed outside demo mode
+    
+    upload_key = getattr(uploaded_file, 'file_id', None) or (uploaded_file.name, uploaded_file.size)
+    tmp_paths = st.session_state.setdefault('_tmp_paths', [])
+    if (
+        st.session_state.get('_tmp_upload_key') == upload_key
+        and tmp_paths
+        and os.path.exists(tmp_paths[-1])
+    ):
+        return tmp_paths[-1]
+    while tmp_paths:
+        try:
+            os.remove(tmp_paths.pop())
+        except OSError:
+            pass
+    uploaded_file.seek(0)
+    with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
+        shutil.copyfileobj(uploaded_file, tmp_file, length=1024 * 1024)
+    tmp_paths.append(tmp_file.name)
+    st.session_state._tmp_upload_key = upload_key
+    return tmp_file.name
+
+@fragment
 def sign_to_text_page():
     st.header("🎥 Sign to Text Language")
     
-    # Language selection
-    col1, col2 = st.columns(2)
-    
-    with col1:
-        source_sign_language = st.selectbox(
-            "Source Sign Language",
-            ["Pakistan Sign Language (PSL)", "American Sign Language (ASL)"],
-            index=0
-        )
-    
-    with col2:
-        target_language = st.selectbox(
-            "Target Language",
-            ["English", "Urdu", "Hindi"],
-            index=0
-        )
-    
-    # Video input options
-    st.subheader("📹 Video Input")
-    
+    # Video input method stays outside the form so the input widgets swap as soon as it changes
     input_method = st.radio(
         "Choose input method:",
         ["Upload Video File", "Record Video", "Use Sample Video"]
     )
     
-    video_input = None
+    # Inputs only apply on submit, so editing them does not rerun the page
+    with st.form(key="sign_to_text", clear_on_submit=False):
+        # Language selection
+        col1, col2 = st.columns(2)
+        
+        with col1:
+            source_sign_language = st.selectbox(
+                "Source Sign Language",
+                ["Pakistan Sign Language (PSL)", "American Sign Language (ASL)"],
+                index=0
+            )
+        
+        with col2:
+            target_language = st.selectbox(
+                "Target Language",
+                ["English", "Urdu", "Hindi"],
+                index=0
+            )
+        
+        st.subheader("📹 Video Input")
+        
+        video_input = None
+        uploaded_file = None
+        
+        if input_method == "Upload Video File":
+            uploaded_file = st.file_uploader(
+                "Upload a sign language video:",
+                type=['mp4', 'avi', 'mov', 'mkv']
+            )
+            if uploaded_file is not None:
+                st.success(f"✅ Video uploaded: {uploaded_file.name}")
+        
+        elif input_method == "Record Video":
+            st.info("🎥 Video recording feature would be available here.")
+            st.write("**Demo Mode**: Video recording is simulated for demonstration purposes.")
+            video_input = "demo_recorded_video.mp4"
+        
+        elif input_method == "Use Sample Video":
+            st.info("📁 Sample video feature would be available here.")
+            st.write("**Demo Mode**: Sample videos are simulated for demonstration purposes.")
+            video_input = "demo_sample_video.mp4"
+        
+        submitted = st.form_submit_button("🔄 Translate to Text", type="primary")
     
-    if input_method == "Upload Video File":
-        uploaded_file = st.file_uploader(
-            "Upload a sign language video:",
-            type=['mp4', 'avi', 'mov', 'mkv']
-        )
+    if submitted:
+        video_hash = None
         if uploaded_file is not None:
-            # Save uploaded file temporarily
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.mp4') as tmp_file:
-                tmp_file.write(uploaded_file.getvalue())
-                video_input = tmp_file.name
-            st.success(f"✅ Video uploaded: {uploaded_file.name}")
-    
-    elif input_method == "Record Video":
-        st.info("🎥 Video recording feature would be available here.")
-        st.write("**Demo Mode**: Video recording is simulated for demonstration purposes.")
-        video_input = "demo_recorded_video.mp4"
-    
-    elif input_method == "Use Sample Video":
-        st.info("📁 Sample video feature would be available here.")
-        st.write("**Demo Mode**: Sample videos are simulated for demonstration purposes.")
-        video_input = "demo_sample_video.mp4"
-    
-    # Translate button
-    if st.button("🔄 Translate to Text", type="primary"):
+            # the upload is only hashed and copied once the form is submitted;
+            # the translation cache is keyed on the full upload, hashed in memory
+            video_hash = upload_digest(uploaded_file)
+            if st.session_state.demo_mode:
+                # demo translations never read the video, so skip the disk copy
+                video_input = uploaded_file.name
+            else:
+                video_input = save_uploaded_video(uploaded_file)
+        
         if video_input:
             with st.spinner("Processing video and translating..."):
                 # Map language selection to model parameter
                 source_lang = "PSL" if "PSL" in source_sign_language else "ASL"
                 
                 # Get translation
-                result, confidence = translate_sign_to_text(video_input, source_lang)
+                result, confidence = translate_sign_to_text(video_input, source_lang, video_hash)
                 
                 # Display results
                 st.success("✅ Translation completed!")
@@ -287,10 +339,7 @@ def sign_to_text_page():
         else:
             st.error("Please provide a video input first.")
 
-def about_page():
-    st.header("ℹ️ About")
-    
-    st.markdown("""
+_ABOUT_MD = """
     ## Sign Language Translator
     
     This application provides translation services between text and sign languages, supporting:
@@ -321,7 +370,20 @@ def about_page():
     - Real-time video processing
     - Enhanced accuracy with larger training datasets
     - Support for more sign languages
-    """)
+    """
+
+@fragment
+def about_page():
+    st.header("ℹ️ About")
+    
+    st.markdown(_ABOUT_MD)
+
+PAGES = {
+    "🏠 Home": home_page,
+    "📝 Text to Sign": text_to_sign_page,
+    "🎥 Sign to Text": sign_to_text_page,
+    "ℹ️ About": about_page,
+}
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -72,7 +72,7 @@ def initialize_models():
                 wlasl_model_path = "wlasl_vit_transformer.pth"
                 if os.path.exists(wlasl_model_path):
                     st.session_state.wlasl_sign_to_text_model = WLASLSignToTextModel()
-                    st.session_state.wlasl_sign_to_text_model.load(wlasl_model_path)
+                    st.session_state.wlasl_sign_to_text_model.load_weights(wlasl_model_path)
                 
                 # Initialize text-to-sign models
                 st.session_state.psl_text_to_sign_model = ConcatenativeSynthesis(
@@ -9,14 +9,57 @@ This script tests the integration of all 4 tasks in the bilingual system:
 4. WLASL Text-to-Sign (Concatenative Synthesis)
 """
 
+import asyncio
+import functools
+import gc
+import io
 import os
 import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Add the project root to the path
 project_root = Path(__file__).parent
 sys.path.insert(0, str(project_root))
 
+PSL_MODEL_PATH = "sign_language_model_best.pth"
+WLASL_MODEL_PATH = "sign_language_translator/assets_WLASL/model/wlasl_sign_cnn_lstm_30frames.pth"
+PSL_ASSETS_PATH = "sign_language_translator/assets"
+WLASL_ASSETS_PATH = "sign_language_translator/assets_WLASL"
+
+# checkpoints are shared between tests; the lock stops two worker threads from both
+# missing the cache and deserializing the same file twice
+_model_load_lock = threading.Lock()
+
+
+@functools.lru_cache(maxsize=4)
+def _load_psl_model(model_path):
+    from sign_language_translator.models import get_model
+    from sign_language_translator.config.enums import ModelCodes
+    
+    return get_model(ModelCodes.PSL_SIGN_TO_TEXT, model_path=model_path, device="cpu")
+
+
+@functools.lru_cache(maxsize=4)
+def _load_wlasl_model(model_path):
+    from sign_language_translator.models import WLASLSignToTextModel
+    
+    return WLASLSignToTextModel.load(model_path, device="cpu")
+
+
+def load_psl_model(model_path=PSL_MODEL_PATH):
+    """Load the PSL sign-to-text checkpoint once per run."""
+    with _model_load_lock:
+        return _load_psl_model(model_path)
+
+
+def load_wlasl_model(model_path=WLASL_MODEL_PATH):
+    """Load the WLASL sign-to-text checkpoint once per run."""
+    with _model_load_lock:
+        return _load_wlasl_model(model_path)
+
+
 def test_model_codes():
     """Test if all model codes are properly registered."""
     print("Testing model codes registration...")
@@ -32,33 +75,37 @@ def test_model_codes():
             'WLASL_CONCATENATIVE_SYNTHESIS'
         ]
         
+        registered_codes = set(dir(ModelCodes))
         for code in required_codes:
-            if hasattr(ModelCodes, code):
+            if code in registered_codes:
                 print(f"✅ {code} model code found")
             else:
                 print(f"❌ {code} model code missing")
                 return False
         
         # Check if they're in the correct groups
-        if ModelCodes.PSL_SIGN_TO_TEXT.value in ModelCodeGroups.ALL_SIGN_TO_TEXT_MODELS.value:
+        sign_to_text_codes = ModelCodeGroups.ALL_SIGN_TO_TEXT_MODELS.value
+        text_to_sign_codes = ModelCodeGroups.ALL_TEXT_TO_SIGN_MODELS.value
+        
+        if ModelCodes.PSL_SIGN_TO_TEXT.value in sign_to_text_codes:
             print("✅ PSL_SIGN_TO_TEXT is in sign-to-text group")
         else:
             print("❌ PSL_SIGN_TO_TEXT is not in sign-to-text group")
             return False
             
-        if ModelCodes.WLASL_SIGN_TO_TEXT.value in ModelCodeGroups.ALL_SIGN_TO_TEXT_MODELS.value:
+        if ModelCodes.WLASL_SIGN_TO_TEXT.value in sign_to_text_codes:
             print("✅ WLASL_SIGN_TO_TEXT is in sign-to-text group")
         else:
             print("❌ WLASL_SIGN_TO_TEXT is not in sign-to-text group")
             return False
             
-        if ModelCodes.CONCATENATIVE_SYNTHESIS.value in ModelCodeGroups.ALL_TEXT_TO_SIGN_MODELS.value:
+        if ModelCodes.CONCATENATIVE_SYNTHESIS.value in text_to_sign_codes:
             print("✅ CONCATENATIVE_SYNTHESIS is in text-to-sign group")
         else:
             print("❌ CONCATENATIVE_SYNTHESIS is not in text-to-sign group")
             return False
             
-        if ModelCodes.WLASL_CONCATENATIVE_SYNTHESIS.value in ModelCodeGroups.ALL_TEXT_TO_SIGN_MODELS.value:
+        if ModelCodes.WLASL_CONCATENATIVE_SYNTHESIS.value in text_to_sign_codes:
             print("✅ WLASL_CONCATENATIVE_SYNTHESIS is in text-to-sign group")
         else:
             print("❌ WLASL_CONCATENATIVE_SYNTHESIS is not in text-to-sign group")
@@ -77,17 +124,15 @@ def test_psl_sign_to_text():
     print("\nTesting PSL Sign-to-Text model...")
     
     try:
-        from sign_language_translator.models import PSLSignToTextModel
-        
         # Check if model file exists
-        model_path = "sign_language_model_best.pth"
+        model_path = PSL_MODEL_PATH
         if not os.path.exists(model_path):
             print(f"⚠️  PSL model file not found: {model_path}")
             print("Skipping PSL sign-to-text test")
             return True
         
         # Try to load the model
-        model = PSLSignToTextModel.load(model_path, device="cpu")
+        model = load_psl_model(model_path)
         
         # Check model structure
         if hasattr(model, 'model') and hasattr(model.model, 'conv_layers'):
@@ -109,17 +154,15 @@ def test_wlasl_sign_to_text():
     print("\nTesting WLASL Sign-to-Text model...")
     
     try:
-        from sign_language_translator.models import WLASLSignToTextModel
-        
         # Check if model file exists
-        model_path = "sign_language_translator/assets_WLASL/model/wlasl_sign_cnn_lstm_30frames.pth"
+        model_path = WLASL_MODEL_PATH
         if not os.path.exists(model_path):
             print(f"⚠️  WLASL model file not found: {model_path}")
             print("Skipping WLASL sign-to-text test")
             return True
         
         # Try to load the model
-        model = WLASLSignToTextModel.load(model_path, device="cpu")
+        model = load_wlasl_model(model_path)
         
         # Check model structure
         if hasattr(model, 'model') and hasattr(model.model, 'conv_layers'):
@@ -148,6 +191,12 @@ def test_psl_text_to_sign():
     """Test PSL Text-to-Sign concatenative synthesis."""
     print("\nTesting PSL Text-to-Sign concatenative synthesis...")
     
+    # don't build the model (and index its assets) just to catch the missing-asset error
+    if not os.path.isdir(PSL_ASSETS_PATH):
+        print(f"⚠️  PSL assets directory not found: {PSL_ASSETS_PATH}")
+        print("Skipping PSL text-to-sign test")
+        return True
+    
     try:
         from sign_language_translator.models import ConcatenativeSynthesis
         
@@ -178,6 +227,11 @@ def test_wlasl_text_to_sign():
     """Test WLASL Text-to-Sign concatenative synthesis."""
     print("\nTesting WLASL Text-to-Sign concatenative synthesis...")
     
+    if not os.path.isdir(WLASL_ASSETS_PATH):
+        print(f"⚠️  WLASL assets directory not found: {WLASL_ASSETS_PATH}")
+        print("Skipping WLASL text-to-sign test")
+        return True
+    
     try:
         from sign_language_translator.models import WLASLConcatenativeSynthesis
         
@@ -224,25 +278,36 @@ def test_model_loader():
         from sign_language_translator.models import get_model
         from sign_language_translator.config.enums import ModelCodes
         
+        # the four loads are independent and mostly disk-bound, so overlap them on threads;
+        # get_model is what the shared PSL loader calls, so that one reuses its instance
+        async def load_models():
+            return await asyncio.gather(
+                asyncio.to_thread(load_psl_model),
+                asyncio.to_thread(get_model, ModelCodes.WLASL_SIGN_TO_TEXT, device="cpu"),
+                asyncio.to_thread(get_model, ModelCodes.CONCATENATIVE_SYNTHESIS,
+                                  text_language="urdu",
+                                  sign_language="pakistan-sign-language",
+                                  sign_format="video"),
+                asyncio.to_thread(get_model, ModelCodes.WLASL_CONCATENATIVE_SYNTHESIS,
+                                  text_language="english",
+                                  sign_format="landmarks"),
+            )
+        
+        psl_model, wlasl_model, psl_t2s_model, wlasl_t2s_model = asyncio.run(load_models())
+        
         # Test loading PSL sign-to-text model
-        psl_model = get_model(ModelCodes.PSL_SIGN_TO_TEXT, device="cpu")
         if psl_model is not None:
             print("✅ PSL sign-to-text model loaded via utility")
         else:
             print("⚠️  PSL sign-to-text model not loaded (might be missing file)")
         
         # Test loading WLASL sign-to-text model
-        wlasl_model = get_model(ModelCodes.WLASL_SIGN_TO_TEXT, device="cpu")
         if wlasl_model is not None:
             print("✅ WLASL sign-to-text model loaded via utility")
         else:
             print("⚠️  WLASL sign-to-text model not loaded (might be missing file)")
         
         # Test loading PSL text-to-sign model
-        psl_t2s_model = get_model(ModelCodes.CONCATENATIVE_SYNTHESIS, 
-                                 text_language="urdu", 
-                                 sign_language="pakistan-sign-language",
-                                 sign_format="video")
         if psl_t2s_model is not None:
             print("✅ PSL text-to-sign model loaded via utility")
         else:
@@ -250,9 +315,6 @@ def test_model_loader():
             return False
         
         # Test loading WLASL text-to-sign model
-        wlasl_t2s_model = get_model(ModelCodes.WLASL_CONCATENATIVE_SYNTHESIS,
-                                   text_language="english",
-                                   sign_format="landmarks")
         if wlasl_t2s_model is not None:
             print("✅ WLASL text-to-sign model loaded via utility")
         else:
@@ -304,10 +366,26 @@ def test_assets_structure():
     print("\nTesting WLASL assets structure...")
     
     try:
-        assets_path = "sign_language_translator/assets_WLASL"
+        assets_path = Path(WLASL_ASSETS_PATH)
+        
+        # one scandir per directory; the entries answer both existence and type checks
+        listings = {}
+        
+        def entries(path):
+            if path not in listings:
+                with os.scandir(path) as it:
+                    listings[path] = {entry.name: entry for entry in it}
+            return listings[path]
+        
+        def is_dir(path):
+            try:
+                entry = entries(path.parent).get(path.name)
+            except OSError:
+                return False
+            return entry is not None and entry.is_dir()
         
         # Check if assets directory exists
-        if not os.path.exists(assets_path):
+        if not is_dir(assets_path):
             print(f"❌ WLASL assets directory not found: {assets_path}")
             return False
         
@@ -319,25 +397,24 @@ def test_assets_structure():
             "Common_WLASL_videos/Common_WLASL_videos"
         ]
         
+        missing_dirs = [subdir for subdir in required_dirs if not is_dir(assets_path / subdir)]
         for subdir in required_dirs:
-            full_path = os.path.join(assets_path, subdir)
-            if os.path.exists(full_path):
+            if subdir not in missing_dirs:
                 print(f"✅ {subdir} directory found")
-            else:
-                print(f"❌ {subdir} directory missing")
-                return False
+        for subdir in missing_dirs:
+            print(f"❌ {subdir} directory missing")
+        if missing_dirs:
+            return False
         
         # Check for model files
-        model_dir = os.path.join(assets_path, "model")
-        model_files = [f for f in os.listdir(model_dir) if f.endswith('.pth')]
+        model_files = [name for name, entry in entries(assets_path / "model").items() if name.endswith('.pth') and entry.is_file()]
         if model_files:
             print(f"✅ Found {len(model_files)} model files")
         else:
             print("⚠️  No model files found")
         
         # Check for mapping files
-        mappings_dir = os.path.join(assets_path, "mappings")
-        mapping_files = [f for f in os.listdir(mappings_dir) if f.endswith('.json')]
+        mapping_files = [name for name, entry in entries(assets_path / "mappings").items() if name.endswith('.json') and entry.is_file()]
         if mapping_files:
             print(f"✅ Found {len(mapping_files)} mapping files")
         else:
@@ -351,6 +428,36 @@ def test_assets_structure():
         return False
 
 
+_captured = threading.local()
+
+
+class _ThreadStdout:
+    """Send print() output from each worker thread into that thread's own buffer."""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        return getattr(_captured, 'buffer', self._stream).write(text)
+
+    def flush(self):
+        getattr(_captured, 'buffer', self._stream).flush()
+
+
+def _run_captured(test):
+    """Run one test and return (passed, captured output)."""
+    _captured.buffer = io.StringIO()
+    try:
+        try:
+            passed = bool(test())
+        except Exception as e:
+            print(f"❌ Test failed with exception: {e}")
+            passed = False
+        return passed, _captured.buffer.getvalue()
+    finally:
+        del _captured.buffer
+
+
 def main():
     """Run all tests for the bilingual system."""
     print("🌐 Bilingual PSL<->WLASL Sign Language System Integration Test")
@@ -370,12 +477,32 @@ def main():
     passed = 0
     total = len(tests)
     
-    for test in tests:
+    # the tests are independent and mostly wait on disk (torch.load, JSON, directory
+    # walks), so run them on threads and print each one's output in the original order.
+    # The package has circular imports, so import it here first; otherwise threads can
+    # see partially initialized modules. A failing import is reported by the tests.
+    # Imports and model loads allocate heavily, so the cyclic GC is paused until the
+    # checks finish and then runs once.
+    gc.disable()
+    stdout = sys.stdout
+    try:
         try:
-            if test():
-                passed += 1
-        except Exception as e:
-            print(f"❌ Test failed with exception: {e}")
+            import sign_language_translator.models  # noqa: F401
+            import sign_language_translator.cli  # noqa: F401
+        except Exception:
+            pass
+        
+        sys.stdout = _ThreadStdout(stdout)
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            results = list(executor.map(_run_captured, tests))
+    finally:
+        sys.stdout = stdout
+        gc.enable()
+        gc.collect()
+    
+    for test_passed, output in results:
+        print(output, end="")
+        passed += test_passed
     
     print("\n" + "=" * 70)
     print(f"Test Results: {passed}/{total} tests passed")
@@ -1,14 +1,22 @@
+import os
 import sys
 
+import torch
+
 from sign_language_translator import ModelCodes
 from sign_language_translator.models import (
     ConcatenativeSynthesis,
     MediaPipeLandmarksModel,
     MixerLM,
     NgramLanguageModel,
+    PSLSignToTextModel,
     TransformerLanguageModel,
 )
-from sign_language_translator.models._utils import get_model
+from sign_language_translator.models._utils import (
+    _PSL_SIGN_TO_TEXT_CACHE_SIZE,
+    _load_psl_sign_to_text,
+    get_model,
+)
 
 
 def test_get_model():
@@ -39,3 +47,23 @@ def test_get_model():
 
     # non-existent model
     assert get_model("non-existent-model-code-should-return-None") is None
+
+
+def test_get_model_psl_sign_to_text_is_cached(tmp_path):
+    model_path = str(tmp_path / "model.pth")
+    torch.save(PSLSignToTextModel(device="cpu").model.state_dict(), model_path)
+
+    model = get_model(ModelCodes.PSL_SIGN_TO_TEXT, model_path=model_path, device="cpu")
+    assert isinstance(model, PSLSignToTextModel)
+    assert get_model(ModelCodes.PSL_SIGN_TO_TEXT, model_path=model_path, device="cpu") is model
+
+    # a rewritten checkpoint is loaded afresh
+    stat = os.stat(model_path)
+    os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    assert get_model(ModelCodes.PSL_SIGN_TO_TEXT, model_path=model_path, device="cpu") is not model
+
+    # superseded checkpoints are evicted rather than kept loaded
+    for seconds in range(2, _PSL_SIGN_TO_TEXT_CACHE_SIZE + 3):
+        os.utime(model_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + seconds * 1_000_000_000))
+        get_model(ModelCodes.PSL_SIGN_TO_TEXT, model_path=model_path, device="cpu")
+    assert _load_psl_sign_to_text.cache_info().currsize <= _PSL_SIGN_TO_TEXT_CACHE_SIZE
@@ -0,0 +1,92 @@
+import numpy as np
+import torch
+
+from sign_language_translator.models.sign_to_text.psl_sign_to_text_model import (
+    PSLSignToTextModel,
+    _frames_to_chw_kernel,
+)
+
+
+def test_process_frame_list():
+    model = PSLSignToTextModel(device="cpu")
+    frames = np.random.default_rng(0).integers(0, 256, size=(10, 64, 64, 3), dtype=np.uint8)
+
+    # stacked array and list of frames give the same (channels, frames, height, width) tensor
+    stacked = model._process_frame_list(frames)
+    from_list = model._process_frame_list(list(frames))
+    assert stacked.shape == (3, 10, 64, 64)
+    assert stacked.dtype == torch.float32
+    assert torch.equal(stacked, from_list)
+    assert torch.equal(stacked[:, 4], torch.from_numpy(frames[4].transpose(2, 0, 1) / np.float32(255.0)))
+
+    # frames of another size are resized first
+    resized = model._process_frame_list(list(np.zeros((5, 120, 90, 3), dtype=np.uint8)))
+    assert resized.shape == (3, 5, 64, 64)
+
+    if _frames_to_chw_kernel is not None:
+        out = np.empty((3, 10, 64, 64), dtype=np.float32)
+        _frames_to_chw_kernel(frames, out)
+        assert np.array_equal(out, from_list.numpy())
+
+
+def test_script_model(tmp_path):
+    model = PSLSignToTextModel(device="cpu")
+    # T/8 * H/8 * W must match the 5120 features of the first fully connected layer
+    clips = torch.rand(2, 3, 16, 16, 10)
+    with torch.inference_mode():
+        eager = model.forward(clips)
+
+    cache_path = str(tmp_path / "model.cpu.torchscript.pt")
+    model.script_model(cache_path)
+    assert (tmp_path / "model.cpu.torchscript.pt").exists()
+    with torch.inference_mode():
+        assert torch.allclose(model.forward(clips), eager, atol=1e-5)
+
+    # a second model reuses the cached graph
+    cached = PSLSignToTextModel(device="cpu")
+    cached.model.load_state_dict(model.model.state_dict())
+    cached.script_model(cache_path)
+    with torch.inference_mode():
+        assert torch.allclose(cached.forward(clips), eager, atol=1e-5)
+
+
+def test_prepare_for_inference():
+    model = PSLSignToTextModel(device="cpu")
+    clips = torch.rand(2, 3, 16, 16, 10)
+    with torch.inference_mode():
+        eager = model.forward(clips)
+
+    model.prepare_for_inference()
+    assert model.model.conv_layers[0].weight.is_contiguous(memory_format=torch.channels_last_3d)
+    with torch.inference_mode():
+        prepared = model.forward(clips)
+    # INT8 fc layers only approximate the FP32 logits
+    assert prepared.shape == eager.shape
+    assert torch.allclose(prepared, eager, atol=0.05)
+
+
+def test_predict_batched():
+    model = PSLSignToTextModel(device="cpu")
+    rng = np.random.default_rng(0)
+    videos = [rng.integers(0, 256, size=(8, 64, 64, 3), dtype=np.uint8) for _ in range(2)]
+
+    # frame inputs go straight into one batch buffer
+    batch = model._process_batch([videos[0], list(videos[1])])
+    assert batch.shape == (2, 3, 8, 64, 64)
+    assert torch.equal(batch[1], model._process_frame_list(videos[1]))
+
+    # T/8 * H/8 * W must match the 5120 features of the first fully connected layer
+    clips = [torch.rand(3, 16, 16, 10) for _ in range(3)]
+    assert model.predict_batched(clips, batch_size=2) == [model.predict(clip) for clip in clips]
+
+
+def test_process_frame_list_without_numba(monkeypatch):
+    from sign_language_translator.models.sign_to_text import psl_sign_to_text_model
+
+    model = PSLSignToTextModel(device="cpu")
+    frames = np.random.default_rng(0).integers(0, 256, size=(10, 64, 64, 3), dtype=np.uint8)
+    expected = model._process_frame_list(list(frames))
+
+    # the vectorized fallback matches the per-frame path bit for bit
+    monkeypatch.setattr(psl_sign_to_text_model, "_frames_to_chw_kernel", None)
+    assert torch.equal(model._process_frame_list(frames), expected)
@@ -0,0 +1,56 @@
+import numpy as np
+import pytest
+import torch
+
+from sign_language_translator.models.sign_to_text.wlasl_sign_to_text_model import WLASLSignToTextModel
+
+
+def test_load_checkpoint(tmp_path):
+    # an empty assets directory gives the small fallback vocabulary
+    trained = WLASLSignToTextModel(device="cpu", assets_path=str(tmp_path))
+    with torch.no_grad():
+        for parameter in trained.model.parameters():
+            parameter.uniform_(-0.1, 0.1)
+
+    model_path = str(tmp_path / "wlasl.pth")
+    trained.save_model(model_path)
+
+    loaded = WLASLSignToTextModel.load(model_path, device="cpu", assets_path=str(tmp_path))
+    for name, tensor in trained.model.state_dict().items():
+        assert torch.equal(loaded.model.state_dict()[name], tensor)
+
+    # a bare state dict loads as well, also through the constructor
+    torch.save(trained.model.state_dict(), model_path)
+    from_init = WLASLSignToTextModel(model_path=model_path, device="cpu", assets_path=str(tmp_path))
+    assert torch.equal(from_init.model.fc_layers[-1].weight, trained.model.fc_layers[-1].weight)
+
+    # a checkpoint for another network is an error, not a silently untrained model
+    torch.save({"model_state_dict": {"unexpected": torch.zeros(1)}}, model_path)
+    with pytest.raises(RuntimeError):
+        WLASLSignToTextModel.load(model_path, device="cpu", assets_path=str(tmp_path))
+
+
+def test_preprocess_features(tmp_path):
+    model = WLASLSignToTextModel(device="cpu", assets_path=str(tmp_path))
+    frames = list(np.random.default_rng(0).integers(0, 256, size=(4, 64, 64, 3), dtype=np.uint8))
+
+    features = model.preprocess_features([{"frame": frame} for frame in frames])
+    assert torch.equal(features, model._process_frame_list(frames))
+
+
+def test_predict_batched_mixed_lengths(tmp_path):
+    model = WLASLSignToTextModel(device="cpu", assets_path=str(tmp_path))
+    rng = np.random.default_rng(0)
+    clips = [
+        list(rng.integers(0, 256, size=(n_frames, 64, 64, 3), dtype=np.uint8))
+        for n_frames in (3, 5, 3, 3, 5)
+    ]
+
+    # (batch, channels, frames, height, width), as the network expects
+    assert model._process_frame_list(clips[1]).shape == (1, 3, 5, 64, 64)
+
+    expected = [model.predict(clip) for clip in clips]
+    assert model.predict_batch(clips) == expected
+    # same-length clips split over several batches keep their order
+    assert model.predict_batched(clips, batch_size=2) == expected
+    assert model.predict_batched([]) == []
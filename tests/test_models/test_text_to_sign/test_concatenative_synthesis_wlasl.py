@@ -0,0 +1,48 @@
+import json
+
+from sign_language_translator.models.text_to_sign import WLASLConcatenativeSynthesis
+from sign_language_translator.models.text_to_sign import concatenative_synthesis_wlasl
+
+
+def test_get_landmarks_path(tmp_path):
+    landmarks_dir = tmp_path / "Augmented_LandMarks" / "Processed_Landmarks_WLASL"
+    for folder in ("book_00335", "book_00336", "thank_you_12345", "notebook_0042", "empty_1"):
+        (landmarks_dir / folder).mkdir(parents=True)
+        if folder != "empty_1":
+            (landmarks_dir / folder / "landmarks_preprocessed.pkl").write_bytes(b"")
+
+    model = WLASLConcatenativeSynthesis(assets_path=str(tmp_path))
+
+    def landmarks_path(folder):
+        return str(landmarks_dir / folder / "landmarks_preprocessed.pkl")
+
+    # exact {gloss}_{video_id} folder, then the first folder with that gloss prefix
+    assert model._get_landmarks_path("book", "00336") == landmarks_path("book_00336")
+    assert model._get_landmarks_path("book", "99999") == landmarks_path("book_00335")
+    assert model._get_landmarks_path("thank_you", "0") == landmarks_path("thank_you_12345")
+
+    # otherwise any folder whose name contains the gloss, as before indexing
+    assert model._get_landmarks_path("note", "0") == landmarks_path("notebook_0042")
+    assert model._get_landmarks_path("thank", "0") == landmarks_path("thank_you_12345")
+
+    # folders without a landmarks file never match
+    assert model._get_landmarks_path("empty", "1") is None
+    assert model._get_landmarks_path("missing", "0") is None
+
+
+def test_wlasl_gloss_index_skips_raw_json_cache(tmp_path):
+    filtered_wlasl = tmp_path / "filtered_wlasl.json"
+    filtered_wlasl.write_text(json.dumps([
+        {"gloss": "book", "instances": [{"video_id": "00335"}, {"video_id": "00336"}]},
+        {"gloss": "thank_you", "instances": [{"video_id": "12345"}]},
+    ]))
+
+    concatenative_synthesis_wlasl._load_json.cache_clear()
+    gloss_to_video_id, video_id_to_gloss = concatenative_synthesis_wlasl._wlasl_gloss_index(
+        str(filtered_wlasl), filtered_wlasl.stat().st_mtime_ns
+    )
+    # the last instance of a gloss wins
+    assert gloss_to_video_id == {"book": "00336", "thank_you": "12345"}
+    assert video_id_to_gloss == {"00335": "book", "00336": "book", "12345": "thank_you"}
+    # only the index is cached, not the parsed list it was built from
+    assert concatenative_synthesis_wlasl._load_json.cache_info().currsize == 0
@@ -0,0 +1,120 @@
+import pickle
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from sign_language_translator.utils.augmentation import (
+    _dict_to_ndarray,
+    _fill_nan_linear,
+    _resample_columns,
+    _resample_columns_jit,
+    augment_complete_to_all,
+    augment_landmarks,
+    preprocess_landmarks,
+)
+
+
+def test_fill_nan_linear():
+    data = np.array(
+        [
+            [np.nan, np.nan, np.nan, 1.0],
+            [1.0, np.nan, 5.0, 2.0],
+            [2.0, np.nan, np.nan, 3.0],
+            [np.nan, np.nan, np.nan, 4.0],
+            [4.0, np.nan, np.nan, 5.0],
+        ]
+    )
+    filled = _fill_nan_linear(data)
+
+    # leading nan is extrapolated, interior gap is interpolated
+    assert np.allclose(filled[:, 0], [0.0, 1.0, 2.0, 3.0, 4.0])
+    # all-nan column is zeroed
+    assert np.allclose(filled[:, 1], 0.0)
+    # single valid sample is held constant
+    assert np.allclose(filled[:, 2], 5.0)
+    # untouched column
+    assert np.allclose(filled[:, 3], data[:, 3])
+
+
+def test_preprocess_landmarks():
+    rng = np.random.default_rng(0)
+    landmarks = rng.normal(size=(57, 543, 3))
+    landmarks[:, 0, :] = np.nan
+
+    processed = preprocess_landmarks(landmarks, target_frames=190)
+    assert processed.shape == (190, 543, 3)
+    assert processed.dtype == np.float32
+    assert not np.isnan(processed).any()
+    assert np.allclose(processed[:, 0, :], 0.0)
+
+    processed = preprocess_landmarks(rng.normal(size=(250, 543, 3)), target_frames=190)
+    assert processed.shape == (190, 543, 3)
+
+    with pytest.raises(ValueError):
+        preprocess_landmarks(np.zeros((10, 42, 3)))
+
+
+def test_resample_columns():
+    data = np.random.default_rng(0).normal(size=(57, 12)).astype(np.float32)
+    data[3:9, 7] = np.nan
+    columns = np.array([0, 1, 2, 7, 11])
+
+    resampled = _resample_columns(data, 190, columns)
+    assert resampled.shape == (190, 12)
+    assert np.allclose(resampled[[0, -1]][:, columns], data[[0, -1]][:, columns])
+    # unselected columns are left as NaN
+    assert np.isnan(resampled[:, 3]).all()
+
+    if _resample_columns_jit is not None:
+        assert np.array_equal(_resample_columns_jit(data, 190, columns), resampled, equal_nan=True)
+
+
+def test_augment_landmarks():
+    landmarks = np.random.default_rng(0).normal(size=(57, 543, 3))
+
+    augmented = augment_landmarks(landmarks, rng=np.random.default_rng(1))
+    assert augmented.shape == landmarks.shape
+    assert augmented.dtype == np.float32
+
+    # same seed, same augmentation
+    again = augment_landmarks(landmarks, rng=np.random.default_rng(1))
+    assert np.array_equal(augmented, again)
+
+
+def test_dict_to_ndarray():
+    parts = {
+        "face": np.ones((10, 468, 3)),
+        "left_hand": np.ones((10, 21, 3)),
+        "pose": np.ones((10, 33, 3)),
+    }
+    landmarks = _dict_to_ndarray(parts)
+    assert landmarks.shape == (10, 543, 3)
+    # missing right hand is zero-filled with the same number of frames
+    assert np.all(landmarks[:, 489:510] == 0)
+    assert np.all(landmarks[:, 510:] == 1)
+
+    array = np.zeros((5, 543, 3))
+    assert _dict_to_ndarray(array) is array
+
+
+def test_augment_complete_to_all(tmp_path):
+    rng = np.random.default_rng(0)
+    sources = ["src_0", "src_1"]
+    targets = [f"tgt_{i}" for i in range(7)]
+    for name in sources + targets:
+        (tmp_path / name).mkdir()
+    for name in sources:
+        with open(tmp_path / name / "landmarks_complete.pkl", "wb") as f:
+            pickle.dump(rng.normal(size=(12, 543, 3)), f)
+    # listed in the dataset but without a folder to write to
+    targets.append("tgt_missing")
+    dataset_csv = tmp_path / "dataset.csv"
+    pd.DataFrame({"video_name": sources + targets, "label": "hello"}).to_csv(dataset_csv, index=False)
+
+    # one worker keeps at most 4 writes pending, fewer than the 8 targets
+    augment_complete_to_all(tmp_path, dataset_csv, num_augmentations_per_source=4, seed=0, max_workers=1)
+    for name in targets[:-1]:
+        with open(tmp_path / name / "landmarks_complete.pkl", "rb") as f:
+            assert pickle.load(f).shape == (12, 543, 3)
+    assert not (tmp_path / "tgt_missing").exists()
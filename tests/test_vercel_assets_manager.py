@@ -0,0 +1,258 @@
+import io
+import json
+import os
+import tempfile
+import types
+
+import pytest
+
+import vercel_assets_manager
+from vercel_assets_manager import VercelAssetsManager
+
+
+class FakeRaw(io.BytesIO):
+    decode_content = False
+
+
+class FakeResponse:
+    def __init__(self, body=b"", status_code=200, headers=None, json_data=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+        self.raw = FakeRaw(body)
+        self._json_data = json_data
+
+    def raise_for_status(self):
+        if self.status_code >= 400:
+            raise RuntimeError(f"HTTP {self.status_code}")
+
+    def json(self):
+        return self._json_data
+
+    def close(self):
+        pass
+
+
+class FakeSession:
+    """Stands in for the pooled requests.Session: url -> handler(headers) -> FakeResponse."""
+
+    def __init__(self):
+        self.handlers = {}
+        self.requests = []
+
+    def get(self, url, stream=False, headers=None):
+        self.requests.append((url, dict(headers or {})))
+        return self.handlers[url](headers or {})
+
+
+class FakeContent:
+    def __init__(self, chunks):
+        self.chunks = chunks
+
+    async def iter_chunked(self, size):
+        for chunk in self.chunks:
+            if isinstance(chunk, Exception):
+                raise chunk
+            yield chunk
+
+
+class FakeAsyncResponse:
+    """Stands in for an aiohttp response; an exception among the chunks breaks the stream there."""
+
+    def __init__(self, chunks=(), status=200, headers=None):
+        self.status = status
+        self.headers = headers or {}
+        self.content = FakeContent(chunks)
+
+    def raise_for_status(self):
+        if self.status >= 400:
+            raise RuntimeError(f"HTTP {self.status}")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+class FakeClientSession:
+    def __init__(self, handlers):
+        self.handlers = handlers
+
+    def get(self, url, headers=None):
+        return self.handlers[url](headers or {})
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        return False
+
+
+def _fake_aiohttp(handlers):
+    return types.SimpleNamespace(
+        TCPConnector=lambda limit: None,
+        ClientSession=lambda connector: FakeClientSession(handlers),
+    )
+
+
+BASE_URL = "https://cdn.example/psl"
+
+
+def _make_manager(tmp_path, **config):
+    manager = VercelAssetsManager(config_path=str(tmp_path / "assets_config.json"))
+    manager.config.update(storage_type="cloud", cloud_provider="cdn", **config)
+    manager.config["base_urls"]["psl_videos"] = BASE_URL
+    manager._session = FakeSession()
+    return manager
+
+
+@pytest.fixture
+def tmp_cache(tmp_path, monkeypatch):
+    # the cache lives under the temp directory
+    monkeypatch.setattr(tempfile, "gettempdir", lambda: str(tmp_path))
+    return tmp_path
+
+
+def test_lru_eviction(tmp_cache):
+    manager = _make_manager(tmp_cache, max_cache_size=12)
+    for name in ("a.mp4", "b.mp4", "c.mp4"):
+        manager._session.handlers[f"{BASE_URL}/{name}"] = lambda headers: FakeResponse(b"12345")
+
+    path_a = manager.download_asset("psl_videos", "a.mp4")
+    path_b = manager.download_asset("psl_videos", "b.mp4")
+    # a cache hit makes "a" the most recently used file
+    assert manager.download_asset("psl_videos", "a.mp4") == path_a
+    assert len(manager._session.requests) == 2
+
+    path_c = manager.download_asset("psl_videos", "c.mp4")
+    assert os.path.exists(path_a) and os.path.exists(path_c)
+    assert not os.path.exists(path_b)
+    assert manager.get_cache_info()["files"] == 2
+    assert manager.get_cache_info()["size"] == 10
+
+    # a restarted manager indexes what is left on disk
+    assert _make_manager(tmp_cache).get_cache_info()["size"] == 10
+
+
+def test_config_without_max_cache_size(tmp_cache):
+    manager = _make_manager(tmp_cache)
+    del manager.config["max_cache_size"]
+    manager._session.handlers[f"{BASE_URL}/a.mp4"] = lambda headers: FakeResponse(b"video")
+
+    path = manager.download_asset("psl_videos", "a.mp4")
+    assert path is not None
+    with open(path, "rb") as f:
+        assert f.read() == b"video"
+
+
+def test_conditional_get(tmp_cache):
+    # every cached copy is expired straight away, so each download revalidates
+    manager = _make_manager(tmp_cache, cache_duration=-1)
+
+    def handler(headers):
+        if headers.get("If-None-Match") == '"v1"':
+            return FakeResponse(status_code=304)
+        return FakeResponse(b"video", headers={"ETag": '"v1"', "Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"})
+
+    manager._session.handlers[f"{BASE_URL}/a.mp4"] = handler
+
+    path = manager.download_asset("psl_videos", "a.mp4")
+    assert manager._session.requests[0][1] == {}
+
+    # a 304 keeps the cached body, also for a restarted manager reading validators.json
+    for current in (manager, _make_manager(tmp_cache, cache_duration=-1)):
+        current._session.handlers = manager._session.handlers
+        current._session.requests = []
+        assert current.download_asset("psl_videos", "a.mp4") == path
+        assert current._session.requests[0][1] == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT",
+        }
+        with open(path, "rb") as f:
+            assert f.read() == b"video"
+
+    # a forced download sends no validators
+    manager._session.requests = []
+    manager.download_asset("psl_videos", "a.mp4", force_download=True)
+    assert manager._session.requests[0][1] == {}
+
+
+def test_manifest_cache(tmp_cache):
+    manager = _make_manager(tmp_cache)
+    manifest_url = f"{BASE_URL}/manifest.json"
+    manager._session.handlers[manifest_url] = lambda headers: FakeResponse(
+        json_data={"psl_videos": ["a.mp4", "b.mp4"]}
+    )
+
+    assert manager.list_available_assets("psl_videos") == ["a.mp4", "b.mp4"]
+    assert manager.list_available_assets("psl_videos") == ["a.mp4", "b.mp4"]
+    assert len(manager._session.requests) == 1
+
+    # the on-disk copy spares a restarted manager the request
+    restarted = _make_manager(tmp_cache)
+    assert restarted.list_available_assets("psl_videos") == ["a.mp4", "b.mp4"]
+    assert restarted._session.requests == []
+    with open(tmp_cache / "slt_assets_cache" / "manifest_psl_videos.json") as f:
+        assert json.load(f) == ["a.mp4", "b.mp4"]
+
+    # an expired manifest is fetched again; a failed fetch lists nothing
+    expired = _make_manager(tmp_cache, cache_duration=-1)
+    expired._session.handlers[manifest_url] = lambda headers: FakeResponse(json_data=None)
+    assert expired.list_available_assets("psl_videos") == []
+    assert len(expired._session.requests) == 1
+
+
+def test_bulk_download_and_mmap(tmp_cache, monkeypatch):
+    monkeypatch.setattr(vercel_assets_manager, "aiohttp", None)
+    manager = _make_manager(tmp_cache)
+    manager._session.handlers[f"{BASE_URL}/a.mp4"] = lambda headers: FakeResponse(b"first")
+    manager._session.handlers[f"{BASE_URL}/b.mp4"] = lambda headers: FakeResponse(b"second")
+    manager._session.handlers[f"{BASE_URL}/missing.mp4"] = lambda headers: FakeResponse(status_code=404)
+
+    paths = manager.download_assets_bulk([("psl_videos", "a.mp4"), ("psl_videos", "missing.mp4"), ("psl_videos", "b.mp4")])
+    assert paths[1] is None
+    assert manager.get_asset_path("psl_videos", "b.mp4") == paths[2]
+
+    mapped = manager.get_asset_mmap("psl_videos", "a.mp4")
+    assert mapped[:] == b"first"
+    mapped.close()
+
+    # pickles would be copied into the heap, so they are refused before any download
+    with pytest.raises(ValueError):
+        manager.get_asset_mmap("psl_videos", "landmarks.pkl")
+
+
+def test_failed_download_leaves_no_partial_file(tmp_cache):
+    class BrokenRaw(FakeRaw):
+        def read(self, *args):
+            raise ConnectionError("connection reset")
+
+    manager = _make_manager(tmp_cache)
+    response = FakeResponse()
+    response.raw = BrokenRaw()
+    manager._session.handlers[f"{BASE_URL}/a.mp4"] = lambda headers: response
+
+    assert manager.download_asset("psl_videos", "a.mp4") is None
+    assert os.listdir(manager.cache_dir) == []
+
+
+def test_bulk_download_aiohttp(tmp_cache, monkeypatch):
+    handlers = {
+        f"{BASE_URL}/a.mp4": lambda headers: FakeAsyncResponse([b"fi", b"rst"]),
+        f"{BASE_URL}/missing.mp4": lambda headers: FakeAsyncResponse(status=404),
+        f"{BASE_URL}/broken.mp4": lambda headers: FakeAsyncResponse([b"half", ConnectionError("reset")]),
+    }
+    monkeypatch.setattr(vercel_assets_manager, "aiohttp", _fake_aiohttp(handlers))
+    manager = _make_manager(tmp_cache)
+    # the thread pool path must not be taken
+    manager._session = None
+
+    paths = manager.download_assets_bulk(
+        [("psl_videos", "a.mp4"), ("psl_videos", "missing.mp4"), ("psl_videos", "broken.mp4")]
+    )
+    assert paths[1] is None and paths[2] is None
+    with open(paths[0], "rb") as f:
+        assert f.read() == b"first"
+    # the interrupted download leaves neither the asset nor its .part file behind
+    assert os.listdir(manager.cache_dir) == [os.path.basename(paths[0])]
+    assert manager.get_cache_info()["size"] == 5
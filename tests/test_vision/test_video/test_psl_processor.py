@@ -0,0 +1,283 @@
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from sign_language_translator.vision.video import psl_processor
+from sign_language_translator.vision.video.psl_processor import (
+    N_LANDMARKS,
+    PSLVideoProcessor,
+)
+
+
+def _processor():
+    # preprocess_features doesn't touch the holistic graph, so skip building one
+    return object.__new__(PSLVideoProcessor)
+
+
+class FakeVideo:
+    """Stands in for cv2.VideoCapture: frame i is an 8x8 image filled with values[i] (default i)."""
+
+    def __init__(self, n_frames, reported_frames=None, fail_at=None, values=None):
+        self.n_frames = n_frames
+        self.values = list(range(n_frames)) if values is None else values
+        self.reported_frames = n_frames if reported_frames is None else reported_frames
+        self.fail_at = fail_at
+        self.position = 0
+        self.retrieved = []
+        self.released = False
+
+    def isOpened(self):
+        return not self.released
+
+    def grab(self):
+        self.position += 1
+        return self.position <= self.n_frames
+
+    def retrieve(self):
+        index = self.position - 1
+        if index == self.fail_at:
+            raise RuntimeError("corrupt frame")
+        self.retrieved.append(index)
+        return True, np.full((8, 8, 3), self.values[index], dtype=np.uint8)
+
+    def get(self, prop):
+        return self.reported_frames
+
+    def set(self, prop, value):
+        pass
+
+    def release(self):
+        self.released = True
+
+
+class FakeHolistic:
+    """Detects only a pose whose x coordinates equal the frame's pixel value."""
+
+    def __init__(self):
+        self.seen = []
+
+    def process(self, rgb_frame):
+        value = int(rgb_frame[0, 0, 0])
+        self.seen.append(value)
+        pose = SimpleNamespace(landmark=[SimpleNamespace(x=value, y=0.5, z=0.0)] * 33)
+        return SimpleNamespace(
+            pose_landmarks=pose, left_hand_landmarks=None, right_hand_landmarks=None, face_landmarks=None
+        )
+
+
+def _video_processor(monkeypatch, video):
+    processor = _processor()
+    processor.landmark_dtype = np.dtype(np.float16)
+    processor.holistic = FakeHolistic()
+    monkeypatch.setattr(processor, "_open_video", lambda video_path: video)
+    return processor
+
+
+def test_preprocess_features_empty_clip():
+    features = {"landmarks": np.zeros((0, N_LANDMARKS, 3), dtype=np.float16)}
+
+    data = _processor().preprocess_features(features)
+    assert data.shape == (0, N_LANDMARKS * 3)
+    assert data.dtype == np.float32
+
+
+def test_smooth_and_normalize_numpy():
+    rng = np.random.default_rng(0)
+    data = rng.random((20, 6)).astype(np.float32)
+    data[:, 2] = 0.5  # constant channel
+
+    out = psl_processor._smooth_and_normalize(data, half_window=2)
+    assert out.shape == data.shape
+    assert out.dtype == np.float32
+
+    # edge-clamped centered moving average followed by a per-column z-score
+    padded = np.pad(data.astype(np.float64), ((2, 2), (0, 0)), mode="edge")
+    smoothed = np.stack([padded[t : t + 5].mean(axis=0) for t in range(len(data))])
+    varying = [0, 1, 3, 4, 5]
+    expected = (smoothed - smoothed.mean(axis=0)) / smoothed.std(axis=0)
+    assert np.allclose(out[:, varying], expected[:, varying], atol=1e-5)
+
+    # channels that don't vary over the clip map to 0
+    assert np.all(out[:, 2] == 0)
+
+
+@pytest.mark.skipif(psl_processor.numba is None, reason="numba is not installed")
+def test_smooth_and_normalize_numba_matches_numpy():
+    rng = np.random.default_rng(0)
+    data = rng.random((37, 12)).astype(np.float32)
+    data[:, 5] = 0.25
+
+    for half_window in (0, 1, 2, 4, 40):
+        expected = psl_processor._smooth_and_normalize(data, half_window)
+        out = psl_processor._smooth_and_normalize_jit(data, half_window)
+        assert out.dtype == np.float32
+        # the kernel is compiled with fastmath, so only approximately equal
+        assert np.allclose(out, expected, atol=1e-4)
+        assert np.all(out[:, 5] == 0)
+
+
+def test_preprocess_features_numpy_fallback(monkeypatch):
+    rng = np.random.default_rng(0)
+    features = {
+        "landmarks": rng.random((15, N_LANDMARKS, 3)).astype(np.float16),
+    }
+    with_kernel = _processor().preprocess_features(features)
+
+    monkeypatch.setattr(psl_processor, "_smooth_and_normalize_jit", None)
+    without_kernel = _processor().preprocess_features(features)
+    assert without_kernel.shape == (15, N_LANDMARKS * 3)
+    assert np.allclose(with_kernel, without_kernel, atol=1e-4)
+
+    empty = {"landmarks": np.zeros((0, N_LANDMARKS, 3), dtype=np.float16)}
+    assert _processor().preprocess_features(empty).shape == (0, N_LANDMARKS * 3)
+
+
+@pytest.mark.parametrize("stride", [0, -1])
+def test_invalid_stride(stride):
+    with pytest.raises(ValueError):
+        _processor().process_video("video.mp4", stride=stride)
+    with pytest.raises(ValueError):
+        _processor().iter_features("video.mp4", stride=stride)
+
+
+def test_open_video_falls_back_without_ffmpeg_backend(monkeypatch):
+    opened = []
+
+    class FakeCapture:
+        def __init__(self, path, *backend):
+            self.backend = backend
+            opened.append(self)
+
+        def isOpened(self):
+            # the FFmpeg backend is missing, any other backend works
+            return not self.backend
+
+        def release(self):
+            pass
+
+        def set(self, prop, value):
+            pass
+
+    monkeypatch.setattr(psl_processor.cv2, "VideoCapture", FakeCapture)
+    cap = PSLVideoProcessor._open_video("video.mp4")
+    assert [capture.backend for capture in opened] == [(psl_processor.cv2.CAP_FFMPEG,), ()]
+    assert cap is opened[-1]
+
+
+@pytest.mark.parametrize("reported_frames", [5, 0])
+def test_process_video(monkeypatch, reported_frames):
+    # a container that reports no frame count makes the feature arrays grow
+    video = FakeVideo(5, reported_frames=reported_frames)
+    processor = _video_processor(monkeypatch, video)
+
+    features = processor.process_video("video.mp4", prefetch=2)
+    assert processor.holistic.seen == [0, 1, 2, 3, 4]
+    assert features["landmarks"].shape == (5, N_LANDMARKS, 3)
+    assert np.all(features["pose_landmarks"][..., 0] == np.arange(5)[:, None])
+    assert features["presence"].tolist() == [[True, False, False, False]] * 5
+    assert video.released
+
+
+def test_process_video_stride(monkeypatch):
+    video = FakeVideo(7)
+    processor = _video_processor(monkeypatch, video)
+
+    features = processor.process_video("video.mp4", stride=3)
+    # skipped frames are grabbed but never decoded
+    assert video.retrieved == [0, 3, 6]
+    assert processor.holistic.seen == [0, 3, 6]
+    assert len(features["landmarks"]) == 3
+
+
+def test_iter_features_early_stop(monkeypatch):
+    video = FakeVideo(100)
+    processor = _video_processor(monkeypatch, video)
+
+    frames = processor.iter_features("video.mp4", prefetch=2)
+    first = next(frames)
+    assert np.all(first["pose_landmarks"][:, 0] == 0)
+    frames.close()
+    # the reader was stopped well before the end of the video and the capture released
+    assert video.released
+    assert video.position < 100
+
+
+def test_reader_error_is_raised(monkeypatch):
+    video = FakeVideo(5, fail_at=2)
+    processor = _video_processor(monkeypatch, video)
+
+    with pytest.raises(RuntimeError, match="corrupt frame"):
+        processor.process_video("video.mp4")
+    assert processor.holistic.seen == [0, 1]
+    assert video.released
+
+    video = FakeVideo(5, fail_at=2)
+    processor = _video_processor(monkeypatch, video)
+    with pytest.raises(RuntimeError, match="corrupt frame"):
+        list(processor.iter_features("video.mp4"))
+    assert video.released
+
+
+def _landmarks(rng, count):
+    return SimpleNamespace(
+        landmark=[SimpleNamespace(x=x, y=y, z=z) for x, y, z in rng.random((count, 3)).tolist()]
+    )
+
+
+def test_packed_landmarks_and_group_views():
+    rng = np.random.default_rng(0)
+    processor = _processor()
+    processor.landmark_dtype = np.dtype(np.float16)
+    results = [
+        SimpleNamespace(
+            pose_landmarks=_landmarks(rng, 33),
+            left_hand_landmarks=None,
+            right_hand_landmarks=_landmarks(rng, 21),
+            face_landmarks=_landmarks(rng, 468),
+        ),
+        SimpleNamespace(
+            pose_landmarks=_landmarks(rng, 33),
+            left_hand_landmarks=_landmarks(rng, 21),
+            right_hand_landmarks=None,
+            face_landmarks=None,
+        ),
+    ]
+    features = processor._allocate_features(len(results))
+    for index, frame_results in enumerate(results):
+        processor._extract_features(frame_results, features, index)
+    features = processor._with_group_views(features)
+
+    assert features["presence"].tolist() == [[True, False, True, True], [True, True, False, False]]
+    for name, count in psl_processor.LANDMARK_COUNTS.items():
+        # each group's view holds what the per-group arrays used to: its landmarks, or zeros
+        expected = np.stack([
+            processor._landmarks_to_array(getattr(frame_results, name)).astype(np.float16)
+            if getattr(frame_results, name)
+            else np.zeros((count, 3), dtype=np.float16)
+            for frame_results in results
+        ])
+        assert features[name].shape == (len(results), count, 3)
+        assert np.array_equal(features[name], expected)
+        assert np.shares_memory(features[name], features["landmarks"])
+
+    # the views tile the packed array in pose | left hand | right hand | face order
+    groups = [features[name] for name in psl_processor.LANDMARK_COUNTS]
+    assert np.array_equal(np.concatenate(groups, axis=1), features["landmarks"])
+
+
+@pytest.mark.parametrize(
+    "motion_threshold, expected_seen",
+    [(None, [0, 0, 1, 40, 40, 200]), (0, [0, 0, 1, 40, 40, 200]), (2.0, [0, 40, 200])],
+)
+def test_motion_gating(monkeypatch, motion_threshold, expected_seen):
+    values = [0, 0, 1, 40, 40, 200]
+    video = FakeVideo(len(values), values=values)
+    processor = _video_processor(monkeypatch, video)
+
+    features = processor.process_video("video.mp4", motion_threshold=motion_threshold)
+    # only enabled gating skips the model on (nearly) static frames ...
+    assert processor.holistic.seen == expected_seen
+    # ... and those frames reuse the landmarks of the last processed frame
+    expected_x = [0, 0, 0, 40, 40, 200] if motion_threshold else values
+    assert np.all(features["pose_landmarks"][..., 0] == np.array(expected_x)[:, None])
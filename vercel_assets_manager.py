@@ -6,13 +6,29 @@ Handles cloud storage, local caching, and fallback options for sign language ass
 
 import os
 import json
+import mmap
+import shutil
 import tempfile
+import threading
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Optional, List
+from typing import Dict, Optional, List, Tuple
+import asyncio
 import hashlib
 import time
 
+try:
+    import aiohttp
+except ImportError:
+    aiohttp = None
+
+# used when the configuration predates the max_cache_size setting
+DEFAULT_MAX_CACHE_SIZE = 1024 * 1024 * 1024  # 1GB
+
 class VercelAssetsManager:
     """Manages assets for Vercel deployment with cloud storage support."""
     
@@ -36,6 +52,89 @@ class VercelAssetsManager:
             "wlasl_videos": "videos/wlasl-*.mp4", 
             "wlasl_landmarks": "landmarks/*.pkl"
         }
+        
+        # asset_type -> (fetch time, asset names) and (asset_type, filename) -> URL;
+        # both are dropped when the storage configuration changes
+        self._manifest_cache: Dict[str, Tuple[float, List[str]]] = {}
+        self._url_cache: Dict[Tuple[str, str], str] = {}
+        
+        # one pooled keep-alive session so repeated and concurrent downloads reuse connections
+        self._session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=32, pool_maxsize=32,
+                              max_retries=Retry(total=3, backoff_factor=0.3))
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+        
+        # cached file -> size, least recently used first, so max_cache_size is enforced
+        # and cache stats are available without walking the directory again
+        self._cache_lock = threading.Lock()
+        self._lru: "OrderedDict[Path, int]" = OrderedDict()
+        self._total_size = 0
+        self._index_cache()
+        
+        # cache key -> {"etag", "last_modified"} from the last download, for conditional GETs
+        self._validators_file = self.cache_dir / "validators.json"
+        self._validators: Dict[str, Dict[str, str]] = self._load_validators()
+    
+    def _load_validators(self) -> Dict[str, Dict[str, str]]:
+        try:
+            with open(self._validators_file, 'r') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return {}
+    
+    def _store_validators(self, cache_key: str, headers):
+        validators = {
+            "etag": headers.get("ETag"),
+            "last_modified": headers.get("Last-Modified"),
+        }
+        with self._cache_lock:
+            if any(validators.values()):
+                self._validators[cache_key] = validators
+            else:
+                self._validators.pop(cache_key, None)
+            try:
+                with open(self._validators_file, 'w') as f:
+                    json.dump(self._validators, f)
+            except OSError:
+                pass
+    
+    @classmethod
+    def _walk_files(cls, directory):
+        """Yield (path, stat) for every file under directory, reusing scandir's entries."""
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_file(follow_symlinks=False):
+                    yield Path(entry.path), entry.stat(follow_symlinks=False)
+                elif entry.is_dir(follow_symlinks=False):
+                    yield from cls._walk_files(entry.path)
+    
+    def _index_cache(self):
+        """Index the files already in the cache directory, oldest first."""
+        # .part files are downloads a previous process didn't finish
+        files = [(path, stat) for path, stat in self._walk_files(self.cache_dir)
+                 if path.name != "validators.json" and path.suffix != ".part"]
+        files.sort(key=lambda item: item[1].st_mtime)
+        with self._cache_lock:
+            self._lru = OrderedDict((path, stat.st_size) for path, stat in files)
+            self._total_size = sum(self._lru.values())
+    
+    def _touch_cache_file(self, cache_file: Path):
+        """Mark a cache file as most recently used."""
+        with self._cache_lock:
+            if cache_file in self._lru:
+                self._lru.move_to_end(cache_file)
+    
+    def _record_cache_file(self, cache_file: Path, size: int):
+        """Mark a cache file as most recently used and evict the oldest files over max_cache_size."""
+        with self._cache_lock:
+            self._total_size += size - self._lru.pop(cache_file, 0)
+            self._lru[cache_file] = size
+            max_cache_size = self.config.get("max_cache_size", DEFAULT_MAX_CACHE_SIZE)
+            while self._total_size > max_cache_size and len(self._lru) > 1:
+                path, evicted_size = self._lru.popitem(last=False)
+                path.unlink(missing_ok=True)
+                self._total_size -= evicted_size
     
     def _load_config(self) -> Dict:
         """Load assets configuration from file."""
@@ -57,7 +156,7 @@ class VercelAssetsManager:
                     "tag": "assets-v1.0"
                 },
                 "cache_duration": 3600,  # 1 hour
-                "max_cache_size": 1024 * 1024 * 1024  # 1GB
+                "max_cache_size": DEFAULT_MAX_CACHE_SIZE
             }
     
     def _save_config(self):
@@ -85,10 +184,18 @@ class VercelAssetsManager:
         elif storage_type == "cdn":
             self.config["base_urls"].update(kwargs)
         
+        self._manifest_cache.clear()
+        self._url_cache.clear()
         self._save_config()
     
     def get_asset_url(self, asset_type: str, filename: str) -> str:
         """Get the URL for a specific asset."""
+        key = (asset_type, filename)
+        if key not in self._url_cache:
+            self._url_cache[key] = self._build_asset_url(asset_type, filename)
+        return self._url_cache[key]
+    
+    def _build_asset_url(self, asset_type: str, filename: str) -> str:
         provider = self.config["cloud_provider"]
         
         if provider == "github":
@@ -120,29 +227,134 @@ class VercelAssetsManager:
             Path to the downloaded file
         """
         # Check cache first
-        cache_key = hashlib.md5(f"{asset_type}_{filename}".encode()).hexdigest()
-        cache_file = self.cache_dir / f"{cache_key}_{filename}"
-        
-        if not force_download and cache_file.exists():
-            # Check if cache is still valid
-            if time.time() - cache_file.stat().st_mtime < self.config["cache_duration"]:
-                return str(cache_file)
+        cache_key, cache_file = self._cache_location(asset_type, filename)
+        fresh, headers = self._check_cache(cache_key, cache_file, force_download)
+        if fresh:
+            return str(cache_file)
         
         # Download from cloud
         url = self.get_asset_url(asset_type, filename)
+        part_file = self._part_file(cache_file)
         
         try:
-            response = requests.get(url, stream=True)
+            response = self._session.get(url, stream=True, headers=headers)
+            if response.status_code == 304 and headers:
+                response.close()
+                os.utime(cache_file)
+                self._touch_cache_file(cache_file)
+                return str(cache_file)
             response.raise_for_status()
             
-            # Save to cache
-            with open(cache_file, 'wb') as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    f.write(chunk)
+            # Save to cache, copying the (decompressed) body in 1 MiB blocks; the body goes
+            # to a .part file first so a failed download never leaves a truncated asset
+            response.raw.decode_content = True
+            with open(part_file, 'wb') as f:
+                shutil.copyfileobj(response.raw, f, length=1024 * 1024)
+            os.replace(part_file, cache_file)
             
+            self._record_cache_file(cache_file, cache_file.stat().st_size)
+            self._store_validators(cache_key, response.headers)
             return str(cache_file)
             
         except Exception as e:
+            part_file.unlink(missing_ok=True)
+            print(f"Error downloading {filename}: {e}")
+            return None
+    
+    def _cache_location(self, asset_type: str, filename: str) -> Tuple[str, Path]:
+        """Cache key and cache file path for an asset."""
+        # only needs to be unique, not cryptographic; blake2b is faster than md5
+        cache_key = hashlib.blake2b(f"{asset_type}_{filename}".encode(), digest_size=16).hexdigest()
+        return cache_key, self.cache_dir / f"{cache_key}_{filename}"
+    
+    @staticmethod
+    def _part_file(cache_file: Path) -> Path:
+        """Temporary file a download is written to before it replaces cache_file."""
+        return cache_file.with_name(cache_file.name + ".part")
+    
+    def _check_cache(self, cache_key: str, cache_file: Path, force_download: bool) -> Tuple[bool, Dict[str, str]]:
+        """
+        Whether the cached copy can be used as-is, and otherwise the request headers to fetch it with.
+        
+        Expired copies are revalidated, so an unchanged asset costs a 304 instead of its body.
+        """
+        headers = {}
+        if not force_download and cache_file.exists():
+            # Check if cache is still valid
+            if time.time() - cache_file.stat().st_mtime < self.config["cache_duration"]:
+                self._touch_cache_file(cache_file)
+                return True, headers
+            
+            validators = self._validators.get(cache_key, {})
+            if validators.get("etag"):
+                headers["If-None-Match"] = validators["etag"]
+            if validators.get("last_modified"):
+                headers["If-Modified-Since"] = validators["last_modified"]
+        return False, headers
+    
+    def download_assets_bulk(self, items: List[Tuple[str, str]], force_download: bool = False) -> List[Optional[str]]:
+        """
+        Download several assets concurrently, e.g. to warm a cold start.
+        
+        Uses aiohttp when it is installed, so all requests are in flight at once on one
+        event loop and the batch takes about as long as the slowest asset; otherwise the
+        downloads run on a thread pool over the shared session. Must not be called from a
+        running event loop.
+        
+        Args:
+            items: (asset_type, filename) pairs
+            force_download: Force download even if cached
+            
+        Returns:
+            Paths to the downloaded files (None for failures), in the order of items
+        """
+        if aiohttp is not None:
+            return asyncio.run(self._download_many_async(items, force_download))
+        with ThreadPoolExecutor(max_workers=16) as executor:
+            return list(executor.map(
+                lambda item: self.download_asset(*item, force_download=force_download), items
+            ))
+    
+    async def _download_many_async(self, items: List[Tuple[str, str]], force_download: bool) -> List[Optional[str]]:
+        connector = aiohttp.TCPConnector(limit=64)
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *(self._fetch_one(session, asset_type, filename, force_download) for asset_type, filename in items)
+            )
+    
+    async def _fetch_one(self, session, asset_type: str, filename: str, force_download: bool) -> Optional[str]:
+        """Async counterpart of ``download_asset``."""
+        cache_key, cache_file = self._cache_location(asset_type, filename)
+        fresh, headers = self._check_cache(cache_key, cache_file, force_download)
+        if fresh:
+            return str(cache_file)
+        
+        url = self.get_asset_url(asset_type, filename)
+        part_file = self._part_file(cache_file)
+        try:
+            async with session.get(url, headers=headers) as response:
+                if response.status == 304 and headers:
+                    os.utime(cache_file)
+                    self._touch_cache_file(cache_file)
+                    return str(cache_file)
+                response.raise_for_status()
+                
+                # all file I/O (open and close included) goes to worker threads so it
+                # doesn't stall the other downloads on the event loop
+                f = await asyncio.to_thread(open, part_file, 'wb')
+                try:
+                    async for chunk in response.content.iter_chunked(1024 * 1024):
+                        await asyncio.to_thread(f.write, chunk)
+                finally:
+                    await asyncio.to_thread(f.close)
+                os.replace(part_file, cache_file)
+                
+                self._record_cache_file(cache_file, cache_file.stat().st_size)
+                self._store_validators(cache_key, response.headers)
+                return str(cache_file)
+        
+        except Exception as e:
+            part_file.unlink(missing_ok=True)
             print(f"Error downloading {filename}: {e}")
             return None
     
@@ -181,6 +393,39 @@ class VercelAssetsManager:
         else:
             raise ValueError(f"Unsupported storage type: {self.config['storage_type']}")
     
+    def get_asset_mmap(self, asset_type: str, filename: str):
+        """
+        Open an asset without copying the whole file into the Python heap.
+        
+        Args:
+            asset_type: Type of asset
+            filename: Name of the file
+            
+        Returns:
+            A read-only memory-mapped array for .npy files, a read-only mmap.mmap of the
+            bytes for anything else (e.g. .mp4), or None if the asset is not available
+            
+        Raises:
+            ValueError: For .pkl files, which can only be loaded by unpickling them into
+                the heap; open the file from ``get_asset_path`` with pickle instead.
+        """
+        suffix = Path(filename).suffix.lower()
+        if suffix == ".pkl":
+            raise ValueError(
+                f"{filename} is a pickle and can't be memory-mapped; load it from get_asset_path() with pickle"
+            )
+        
+        path = self.get_asset_path(asset_type, filename)
+        if path is None:
+            return None
+        
+        if suffix == ".npy":
+            import numpy as np
+            return np.load(path, mmap_mode="r")
+        with open(path, 'rb') as f:
+            # the mapping stays valid after the file is closed
+            return mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    
     def list_available_assets(self, asset_type: str) -> List[str]:
         """List available assets for a given type."""
         if self.config["storage_type"] == "local":
@@ -197,42 +442,66 @@ class VercelAssetsManager:
         
         elif self.config["storage_type"] == "cloud":
             # For cloud storage, you might need to maintain a manifest file
-            manifest_url = self.get_asset_url(asset_type, "manifest.json")
-            try:
-                response = requests.get(manifest_url)
-                manifest = response.json()
-                return manifest.get(asset_type, [])
-            except:
-                return []
+            return list(self._get_manifest(asset_type))
         
         return []
     
+    def _get_manifest(self, asset_type: str) -> List[str]:
+        """Asset names from the remote manifest, cached in memory and on disk for cache_duration."""
+        now = time.time()
+        cached = self._manifest_cache.get(asset_type)
+        if cached is not None and now - cached[0] < self.config["cache_duration"]:
+            return cached[1]
+        
+        # the on-disk copy lets a restarted process skip the request too
+        manifest_file = self.cache_dir / f"manifest_{asset_type}.json"
+        try:
+            fetched_at = manifest_file.stat().st_mtime
+            if now - fetched_at < self.config["cache_duration"]:
+                with open(manifest_file, 'r') as f:
+                    assets = json.load(f)
+                self._manifest_cache[asset_type] = (fetched_at, assets)
+                return assets
+        except (OSError, ValueError):
+            pass
+        
+        manifest_url = self.get_asset_url(asset_type, "manifest.json")
+        try:
+            response = self._session.get(manifest_url)
+            manifest = response.json()
+            assets = manifest.get(asset_type, [])
+        except Exception:
+            return []
+        
+        self._manifest_cache[asset_type] = (now, assets)
+        try:
+            with open(manifest_file, 'w') as f:
+                json.dump(assets, f)
+            self._record_cache_file(manifest_file, manifest_file.stat().st_size)
+        except OSError:
+            pass
+        return assets
+    
     def clear_cache(self):
         """Clear the asset cache."""
-        import shutil
         if self.cache_dir.exists():
             shutil.rmtree(self.cache_dir)
         self.cache_dir.mkdir(exist_ok=True)
+        self._manifest_cache.clear()
+        with self._cache_lock:
+            self._lru.clear()
+            self._total_size = 0
+            self._validators.clear()
         print("Cache cleared successfully")
     
     def get_cache_info(self) -> Dict:
         """Get information about the cache."""
-        if not self.cache_dir.exists():
-            return {"size": 0, "files": 0}
-        
-        total_size = 0
-        file_count = 0
-        
-        for file_path in self.cache_dir.rglob("*"):
-            if file_path.is_file():
-                total_size += file_path.stat().st_size
-                file_count += 1
-        
-        return {
-            "size": total_size,
-            "files": file_count,
-            "cache_dir": str(self.cache_dir)
-        }
+        with self._cache_lock:
+            return {
+                "size": self._total_size,
+                "files": len(self._lru),
+                "cache_dir": str(self.cache_dir)
+            }
 
 # Integration with sign_language_translator
 def setup_vercel_assets():